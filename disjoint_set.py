@@ -9,6 +9,9 @@
 # em muito contribuíram para a minha compreensão dos algoritmos.
 #
 
+import numpy as np
+from array import array
+
 def initialize(nodes):
 
     """
@@ -171,20 +174,139 @@ def components(nodes, edges):
 
     """
 
-    cont = len(nodes)
-    boss, height = initialize(nodes)
-
-    for edge in edges:
-        
-        represent0 = find_path_compression(edge[0], boss)
-        represent1 = find_path_compression(edge[1], boss)
-        
-        if represent0 != represent1:
-            union_rank(represent0, represent1, boss, height)
-            cont -= 1
+    sets = DisjointSet(len(nodes))
+    sets.union_many([edge[0] for edge in edges], [edge[1] for edge in edges])
+    cont = sets.count
 
     return cont
 
+class DisjointSet():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para representação de disjoint-set em vetores tipados (array('i')). A busca
+    pelo representante aplica divisão de caminho (path halving), de forma iterativa: cada
+    nó visitado passa a apontar para o seu avô. A união é feita por tamanho, isto é, a
+    partição menor é pendurada na maior.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - n : número de nós (enumerados de 0 a n-1).
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - parent : vetor de chefes de cada nó;
+
+    - size : vetor de tamanhos das partições (válido para os representantes);
+
+    - count : número de partições.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : inicializa n partições unitárias;
+
+    - find : retorna o representante da partição de um nó;
+
+        * Argumentos: 
+
+            - node : nó (número do nó).
+
+    - union : une as partições de dois nós e retorna True caso fossem distintas;
+
+        * Argumentos: 
+
+            - node0 : primeiro nó (número do nó);
+
+            - node1 : segundo nó (número do nó).
+
+    - union_many : aplica union, em ordem, a cada par (src[k], dst[k]) e retorna
+    vetor booleano indicando os pares que efetivamente uniram partições. Encerra
+    assim que resta uma única partição;
+
+        * Argumentos: 
+
+            - src : sequência de primeiros nós;
+
+            - dst : sequência de segundos nós.
+
+    - roots : retorna vetor numpy com o representante de cada nó.
+
+    """
+
+    __slots__ = ("parent", "size", "count")
+
+    def __init__(self, n):
+
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.count = n
+
+    def find(self, node):
+
+        parent = self.parent
+
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+
+        return node
+
+    def union(self, node0, node1):
+
+        root0 = self.find(node0)
+        root1 = self.find(node1)
+
+        if root0 == root1:
+            return False
+
+        size = self.size
+        if size[root0] < size[root1]:
+            root0, root1 = root1, root0
+
+        self.parent[root1] = root0
+        size[root0] += size[root1]
+        self.count -= 1
+
+        return True
+
+    def union_many(self, src, dst):
+
+        if isinstance(src, np.ndarray):
+            src, dst = src.tolist(), dst.tolist()
+
+        merged = np.zeros(len(src), dtype=bool)
+
+        for k in range(len(src)):
+            if self.count == 1:
+                break
+            if self.union(src[k], dst[k]):
+                merged[k] = True
+
+        return merged
+
+    def roots(self):
+
+        # Salto de ponteiros (pointer jumping) sobre uma vista numpy de parent, que 
+        # também fica inteiramente comprimido ao final.
+        parent = np.frombuffer(self.parent, dtype=np.int32)
+
+        while True:
+            grand = parent[parent]
+            if (grand == parent).all():
+                break
+            parent[:] = grand
+
+        return parent.copy()
+
 #################################################################
 ### Exemplo  do algoritmo de contagem de componentes em grafo ###
 #################################################################
@@ -13,6 +13,7 @@ from str_reduc import *
 
 ## Geração do conjunto de imagens ##
 
+workers = None # Número de threads na construção do grafo (None: todas as disponíveis)
 rng = np.random.default_rng(seed=0)
 matrix = rng.choice([0, 1], (28, 28), p=[0.5, 0.5])
 num_matrix = 100
@@ -37,7 +38,7 @@ for row in range(matrix.shape[0]):
     ## Construção do grafo de diferenças ##
 
     nodes = list(range(len(samples)))
-    edges = edges_constructor_numba(np.array(samples))
+    edges = edges_to_list(*edges_constructor_parallel(np.array(samples), workers=workers))
     G = adj_list(nodes, edges, directed=False)
     G.construct_adj_list()
 
@@ -16,12 +16,14 @@ from str_reduc import *
 rng = np.random.default_rng(seed=0)
 m = 4
 n = (4096*3)//m
+workers = None # Número de threads na construção do grafo (None: todas as disponíveis)
+depth_bound = None # Máximo de saltos até um vetor completo na reconstrução (None: sem limite)
 matrix = rng.choice([0, 1], (n, m), p=[0.5, 0.5]).tolist()
 
 ## Construção do grafo de diferenças ##
 
 nodes = list(range(len(matrix)))
-edges = edges_constructor_numba(np.array(matrix))
+edges = edges_to_list(*edges_constructor_parallel(np.array(matrix), workers=workers))
 G = adj_list(nodes, edges, directed=False)
 G.construct_adj_list()
 
@@ -40,7 +42,9 @@ T.construct_adj_list()
 
 ## Construção da matriz de armazenamento ótimo ##
 
-opt_matrix = opt_matrix_constructor(matrix, pred_list, centroid)
+opt_matrix = opt_matrix_constructor(matrix, pred_list, centroid, depth_bound=depth_bound)
+packed = packed_opt_matrix(matrix, pred_list, centroid, depth_bound=depth_bound)
+report = checkpoint_report(opt_matrix, centroid)
 
 ## Reconstrução das amostras da matriz original #
 
@@ -50,6 +54,9 @@ for i in range(len(matrix)):
     orig_matrix0.append(reconstruct_vector(opt_matrix, centroid, i))
 end0 = time.time()
 
+beg2 = time.time()
+orig_matrix2 = reconstruct_all(opt_matrix, centroid)
+end2 = time.time()
 
 beg1 = time.time()
 orig_matrix1 = []
@@ -60,6 +67,9 @@ end1 = time.time()
 print(f"Original matrix size: {size(matrix)}\
       \nOpt. matrix size: {size(opt_matrix)}\
       \nStorage reduction: {(1 - (size(opt_matrix)/size(matrix)))*100}%\
+      \nStorage reduction in bytes: {(1 - (packed.nbytes/np.asarray(matrix, dtype=packed.diff_val.dtype).nbytes))*100}%\
+      \nCheckpoints: {report['checkpoints']} (max. hops: {report['max_hops']}, mean hops: {report['mean_hops']})\
       \nReconstruction and acess time reason: {(end0-beg0)/(end1-beg1)}\
+      \nBatch reconstruction and acess time reason: {(end2-beg2)/(end1-beg1)}\
       \nMST average cost: {cost/(len(matrix) - 1)}\
       \nMST average cost upper limit: {0.5*(len(matrix[0]) - 2)}")
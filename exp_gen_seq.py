@@ -14,12 +14,13 @@ from str_reduc import *
 rng = np.random.default_rng(seed=0)
 m = 10
 n = 1000
+workers = None # Número de threads na construção do grafo (None: todas as disponíveis)
 matrix = rng.choice([-2, -1, 1, 2], (n, m), p=[0.25, 0.25, 0.25, 0.25]).tolist()
 
 ## Construção do grafo de diferenças ##
 
 nodes = list(range(len(matrix)))
-edges = edges_constructor_numba(np.array(matrix))
+edges = edges_to_list(*edges_constructor_parallel(np.array(matrix), workers=workers))
 G = adj_list(nodes, edges, directed=False)
 G.construct_adj_list()
 
@@ -39,9 +40,11 @@ T.construct_adj_list()
 ## Construção da matriz de armazenamento ótimo ##
 
 opt_matrix = opt_matrix_constructor(matrix, pred_list, centroid)
+packed = packed_opt_matrix(matrix, pred_list, centroid)
 
 print(f"Original matrix size: {size(matrix)}\
       \nOpt. matrix size: {size(opt_matrix)}\
       \nStorage reduction: {(1 - (size(opt_matrix)/size(matrix)))*100}%\
+      \nStorage reduction in bytes: {(1 - (packed.nbytes/np.asarray(matrix, dtype=packed.diff_val.dtype).nbytes))*100}%\
       \nMST average cost: {cost/(len(matrix) - 1)}\
       \nMST average cost upper limit: {0.5*(len(matrix[0]) - 2)}")
@@ -12,6 +12,7 @@ from str_reduc import *
 if __name__ == "__main__":
 
     n_var = 50
+    workers = None # Número de threads na construção do grafo (None: todas as disponíveis)
     time_exec = []
     size_mat = list(range(100, 1000, n_var))
     str_reduc = []
@@ -28,7 +29,7 @@ if __name__ == "__main__":
         matrix = rng.choice([0, 1], (i, 10), p=[1/2, 1/2]).tolist()
 
         nodes = list(range(len(matrix)))
-        edges = edges_constructor_numba(np.array(matrix))
+        edges = edges_to_list(*edges_constructor_parallel(np.array(matrix), workers=workers))
 
         G = adj_list(nodes, edges, directed=False)
         G.construct_adj_list()
@@ -312,6 +312,143 @@ def heapsort_graph(vec, n):
 
     return vec
 
+class index_heap():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para representação de min-heap indexada por nó. Diferente das funções acima,
+    em que a heap guarda arestas e não se sabe onde cada uma está, aqui a heap guarda nós,
+    cada um com uma única chave, e um mapa de posições indica o índice de cada nó no vetor
+    da heap. Assim, a diminuição de chave (decrease_key) é feita em O(log n) e a heap
+    nunca possui mais de n elementos.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - n : número de nós (enumerados de 0 a n-1).
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - heap : lista de nós organizada como min-heap em relação às chaves;
+
+    - pos : lista com a posição de cada nó em heap (-1 caso o nó não esteja na heap);
+
+    - key : lista com a chave de cada nó.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : inicializa heap vazia para n nós;
+
+    - insert : adiciona nó à heap;
+
+        * Argumentos: 
+
+            - node : nó (número do nó) a ser adicionado;
+
+            - key : chave do nó.
+
+    - extract_min : retira e retorna o nó de menor chave e sua chave;
+
+    - decrease_key : diminui a chave de um nó presente na heap;
+
+        * Argumentos: 
+
+            - node : nó (número do nó) a ter chave alterada;
+
+            - key : novo valor da chave.
+
+    - fix_up / fix_down : "arrumam para cima" / "para baixo" a heap a partir de
+    uma posição.
+
+    """
+
+    def __init__(self, n):
+
+        self.heap = []
+        self.pos = [-1 for _ in range(n)]
+        self.key = [None for _ in range(n)]
+
+    def __len__(self):
+
+        return len(self.heap)
+
+    def __contains__(self, node):
+
+        return self.pos[node] != -1
+
+    def fix_up(self, k):
+
+        heap, pos, key = self.heap, self.pos, self.key
+        node = heap[k]
+
+        while k > 0 and key[heap[(k-1)//2]] > key[node]:
+            heap[k] = heap[(k-1)//2]
+            pos[heap[k]] = k
+            k = (k-1)//2
+
+        heap[k] = node
+        pos[node] = k
+
+        return
+
+    def fix_down(self, k):
+
+        heap, pos, key = self.heap, self.pos, self.key
+        n = len(heap)
+        node = heap[k]
+
+        while 2*k + 1 <= n-1:
+            j = 2*k + 1
+            if j < n-1 and key[heap[j]] > key[heap[j+1]]:
+                j += 1
+            if key[node] <= key[heap[j]]:
+                break
+            heap[k] = heap[j]
+            pos[heap[k]] = k
+            k = j
+
+        heap[k] = node
+        pos[node] = k
+
+        return
+
+    def insert(self, node, key):
+
+        self.key[node] = key
+        self.heap.append(node)
+        self.fix_up(len(self.heap)-1)
+
+        return
+
+    def extract_min(self):
+
+        heap = self.heap
+        minim = heap[0]
+        last = heap.pop(-1)
+
+        if len(heap) != 0:
+            heap[0] = last
+            self.fix_down(0)
+
+        self.pos[minim] = -1
+
+        return minim, self.key[minim]
+
+    def decrease_key(self, node, key):
+
+        self.key[node] = key
+        self.fix_up(self.pos[node])
+
+        return
+
 ###############################################
 ### Exemplo de heapsort em arestas de grafo ###
 ###############################################
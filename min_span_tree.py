@@ -1,11 +1,14 @@
 import math
+import numpy as np
+from collections import deque
+from numba import njit
 import networkx as nx
 import matplotlib.pyplot as plt
 from net_represent import *
 from heap_graph import *
 from disjoint_set import *
 
-def kruskal(nodes, edges, sorted=False, shallow=False):
+def kruskal(nodes, edges, sorted=False, shallow=False, engine="python"):
 
     """
     _________________
@@ -22,47 +25,226 @@ def kruskal(nodes, edges, sorted=False, shallow=False):
     --- Argumentos ---
     __________________
 
-    - nodes : lista de nós (enumerados);
+    - nodes : lista de nós (enumerados ou com nome);
 
-    - edges : lista de arestas do grafo;
+    - edges : lista de arestas do grafo, com os nós dados por seus identificadores;
 
     - sorted : variável booleana que indica se edges já foi previamente ordenada.
-    Por padrão, False.
+    Por padrão, False;
+
+    - engine : "python" ou "numba". No segundo caso, a AGM é calculada pelo núcleo
+    compilado kruskal_numba sobre vetores de arestas, e edges pode também ser uma
+    tupla de vetores (src, dst, weight). Por padrão, "python".
 
     ______________
     --- Saídas ---
     ______________
 
-    - tree_edges : lista de arestas da AGM;
+    - tree_edges : lista de arestas da AGM, com os nós dados por seus identificadores
+    (node_map), isto é, suas posições em nodes;
 
     - cost : custo total da AGM.
 
     """
 
+    if engine == "numba":
+        src, dst, weight = aux_edge_arrays(edges)
+        tree = kruskal_numba(len(nodes), src, dst, weight)
+        if isinstance(edges, tuple):
+            tree_edges = [[int(src[e]), int(dst[e]), weight[e].item()] for e in tree]
+        else:
+            tree_edges = [edges[e] for e in tree]
+        cost = sum(edge[2] for edge in tree_edges)
+        return tree_edges, cost
+
     if not sorted:
         heapsort_graph(edges, len(edges))
         edges.reverse()
         # edges.sort(key=aux_sort)
 
-    boss, height = initialize(nodes)
+    sets = DisjointSet(len(nodes))
     tree_edges = []
     cost = 0
-    
-    for edge in edges:
-
-        node0 = edge[0]
-        node1 = edge[1]
 
-        direc0 = find(node0, boss)
-        direc1 = find(node1, boss)
+    for edge in edges:
 
-        if direc0 != direc1:
+        if sets.union(edge[0], edge[1]):
             tree_edges.append(edge)
             cost += edge[2]
-            union_rank(direc0, direc1, boss, height)
+
+            if sets.count == 1:
+                break
 
     return tree_edges, cost 
 
+def aux_kruskal_numba(num_nodes, src, dst, weight):
+
+    order = np.argsort(weight, kind="mergesort")
+    parent = np.arange(num_nodes)
+    size = np.ones(num_nodes, dtype=np.int64)
+    tree = np.empty(max(num_nodes - 1, 0), dtype=np.int64)
+    count = 0
+
+    for e in order:
+
+        if count == num_nodes - 1:
+            break
+
+        root0 = src[e]
+        while parent[root0] != root0:
+            parent[root0] = parent[parent[root0]]
+            root0 = parent[root0]
+
+        root1 = dst[e]
+        while parent[root1] != root1:
+            parent[root1] = parent[parent[root1]]
+            root1 = parent[root1]
+
+        if root0 != root1:
+            if size[root0] < size[root1]:
+                root0, root1 = root1, root0
+            parent[root1] = root0
+            size[root0] += size[root1]
+            tree[count] = e
+            count += 1
+
+    return tree[:count]
+
+kruskal_numba = njit(aux_kruskal_numba, cache=True)
+
+def kruskal_bucket(nodes, edges, max_weight=None):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Variante do algoritmo de Kruskal para grafos cujos custos são inteiros não negativos
+    e limitados, como as distâncias de Hamming do grafo de similaridade (custos em [0, m]).
+    Em vez de ordenar as arestas por comparação, distribuem-se as arestas em baldes, um
+    para cada custo possível (ordenação por contagem), em O(E + m). Os baldes são então
+    percorridos em ordem crescente de custo, e o algoritmo encerra assim que a AGM atinge
+    (número de nós do grafo) - 1 arestas.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - edges : lista de arestas do grafo (por identificadores), com custos inteiros não
+    negativos;
+
+    - max_weight : maior custo possível das arestas. Por padrão, None, isto é, o maior
+    custo encontrado em edges.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - tree_edges : lista de arestas da AGM, com os nós dados por seus identificadores;
+
+    - cost : custo total da AGM.
+
+    """
+
+    if max_weight is None:
+        max_weight = max(edge[2] for edge in edges) if len(edges) != 0 else 0
+
+    buckets = [[] for _ in range(max_weight + 1)]
+    for edge in edges:
+        buckets[edge[2]].append(edge)
+
+    sets = DisjointSet(len(nodes))
+    tree_edges = []
+    cost = 0
+
+    for bucket in buckets:
+        for edge in bucket:
+
+            if sets.union(edge[0], edge[1]):
+                tree_edges.append(edge)
+                cost += edge[2]
+
+                if sets.count == 1:
+                    return tree_edges, cost
+
+    return tree_edges, cost
+
+def boruvka(nodes, edges):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    A função aplica o algoritmo de Borůvka para encontrar a árvore geradora mínima (AGM)
+    de um grafo não direcionado. A cada rodada, encontra-se, para toda componente, o arco
+    mais barato que a liga a outra componente; todos esses arcos são adicionados à AGM e
+    as componentes correspondentes são unidas (disjoint-set). Como o número de componentes
+    cai ao menos pela metade a cada rodada, são necessárias O(log n) rodadas.
+
+    A busca pelos arcos mais baratos é feita de uma só vez, com reduções do numpy sobre os
+    vetores de arestas. Empates são desfeitos pela posição da aresta, de modo que a ordem
+    entre arcos seja total e nenhum ciclo seja formado.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - edges : lista de arestas do grafo (por identificadores) ou tupla de vetores 
+    (src, dst, weight).
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - tree_edges : lista de arestas da AGM, com os nós dados por seus identificadores;
+
+    - cost : custo total da AGM.
+
+    """
+
+    src, dst, weight = aux_edge_arrays(edges)
+    num_nodes = len(nodes)
+    num_edges = len(weight)
+
+    order = np.argsort(weight, kind="stable")
+    rank = np.empty(num_edges, dtype=np.int64)
+    rank[order] = np.arange(num_edges)
+
+    sets = DisjointSet(num_nodes)
+    tree_edges = []
+    cost = 0
+    active = np.arange(num_edges)
+
+    while sets.count > 1:
+
+        comp = sets.roots()
+        comp0 = comp[src[active]]
+        comp1 = comp[dst[active]]
+
+        cross = comp0 != comp1
+        active, comp0, comp1 = active[cross], comp0[cross], comp1[cross]
+        if len(active) == 0:
+            break
+
+        # Menor posição (na ordem por custo) entre os arcos que deixam cada componente
+        cheapest = np.full(num_nodes, num_edges, dtype=np.int64)
+        np.minimum.at(cheapest, comp0, rank[active])
+        np.minimum.at(cheapest, comp1, rank[active])
+
+        for edge in order[np.unique(cheapest[cheapest < num_edges])]:
+
+            if sets.union(int(src[edge]), int(dst[edge])):
+                local_cost = weight[edge].item()
+                tree_edges.append([int(src[edge]), int(dst[edge]), local_cost])
+                cost += local_cost
+
+    return tree_edges, cost
+
 def find_min_prim(visited, unvisited, adj, shallow=False):
 
     """
@@ -157,11 +339,12 @@ def prim(nodes, adj, s=0, shallow=False):
     --- Argumentos ---
     __________________
 
-    - nodes : lista de nós (enumerados);
+    - nodes : lista de nós (enumerados ou com nome);
 
     - adj : lista de adjacência representando o grafo;
 
-    - s : nó de partida. Como padrão, s = 0, isto é, o primeiro nó de nodes;
+    - s : identificador do nó de partida. Como padrão, s = 0, isto é, o primeiro nó de
+    nodes;
 
     - shallow : valor booleano que condiciona o algoritmo de Prim a encontrar a AGM mais
     rasa. Por padrão, False.
@@ -178,7 +361,7 @@ def prim(nodes, adj, s=0, shallow=False):
 
     cost = 0
     visited = [s]
-    unvisited = set(nodes)
+    unvisited = set(range(len(nodes)))
     unvisited.remove(s)
     tree_edges = []
 
@@ -196,7 +379,7 @@ def prim(nodes, adj, s=0, shallow=False):
     
     return tree_edges, cost 
 
-def prim_heap(nodes, adj, s=0, shallow=False):
+def prim_heap(nodes, adj, s=0, shallow=False, engine="python"):
 
     """
     _________________
@@ -210,20 +393,27 @@ def prim_heap(nodes, adj, s=0, shallow=False):
     Ademais, aplica-se uma pequena modificação a qual prioriza, quando possível, a
     busca por AGM's rasas. Ao selecionar o arco mais barato (i, j), analisa-se se há mais
     de uma arco com o mesmo custo: em caso positivo, toma-se o arco cujo nó j possui mais 
-    graus de saída; caso contrário, toma-se (i, j).
+    graus de saída; caso contrário, toma-se (i, j). O desempate é embutido na própria 
+    prioridade da heap, dada pelo par (custo, -grau de j), com os graus calculados uma 
+    única vez; logo, o modo raso custa O(log n) por passo, como o modo usual.
 
     __________________
     --- Argumentos ---
     __________________
 
-    - nodes : lista de nós (enumerados);
+    - nodes : lista de nós (enumerados ou com nome);
 
-    - adj : lista de adjacência representando o grafo;
+    - adj : lista de adjacência (ou objeto da classe csr_graph) representando o grafo;
 
-    - s : nó de partida. Como padrão, s = 0, isto é, o primeiro nó de nodes;
+    - s : identificador do nó de partida. Como padrão, s = 0, isto é, o primeiro nó de
+    nodes;
 
     - shallow : valor booleano que condiciona o algoritmo de Prim a encontrar a AGM mais
-    rasa. Por padrão, False.
+    rasa. Por padrão, False;
+
+    - engine : "python" ou "numba". No segundo caso, a AGM é calculada pelo núcleo
+    compilado prim_heap_numba, com heap indexada, sobre a adjacência em formato CSR.
+    Por padrão, "python".
 
     ______________
     --- Saídas ---
@@ -235,31 +425,36 @@ def prim_heap(nodes, adj, s=0, shallow=False):
 
     """
 
+    if engine == "numba":
+        indptr, indices, weights = aux_csr_arrays(adj)
+        start, end, local_cost = prim_heap_numba(indptr, indices, weights, s, shallow)
+        tree_edges = [list(edge) for edge in zip(start.tolist(), end.tolist(), local_cost.tolist())]
+        cost = sum(local_cost.tolist())
+        return tree_edges, cost
+
     cost = 0
     visited = set([s])
-    unvisited = set(nodes)
+    unvisited = set(range(len(nodes)))
     unvisited.remove(s)
     tree_edges = []
     
+    # No modo raso, a prioridade de cada arco (i, j) é o par (custo, -grau de j), de modo
+    # que, entre arcos de mesmo custo, a heap entregue primeiro o de nó j com mais ligações.
+    if shallow:
+        degree = aux_degree(adj)
+
     fringe = []
     for edge in adj[s]:
-        add_to_heap_graph(fringe, [s, edge[0], edge[1]])
+        key = (edge[1], -degree[edge[0]]) if shallow else edge[1]
+        add_to_heap_graph(fringe, [s, edge[0], key])
     
     while(len(unvisited) != 0):
         
         while (len(fringe) != 0) and (fringe[0][1] in visited):
             extract_min_graph(fringe)
 
-        if shallow:
-
-            i = 1
-            while i < len(fringe) and (fringe[0][2] == fringe[i][2]) and len(adj[fringe[i][1]]) > len(adj[fringe[i-1][1]]):
-                i += 1
-            start_node, end_node, local_cost = fringe[i-1]
-            delete_elem_graph(fringe, i-1)
-            
-        else:
-            start_node, end_node, local_cost = extract_min_graph(fringe)
+        start_node, end_node, key = extract_min_graph(fringe)
+        local_cost = key[0] if shallow else key
         
         start_node, end_node = int(start_node), int(end_node)
         tree_edges.append([start_node, end_node, local_cost])
@@ -271,62 +466,354 @@ def prim_heap(nodes, adj, s=0, shallow=False):
 
         for edge in adj[end_node]:
             if edge[0] not in visited:
-                add_to_heap_graph(fringe, [end_node, edge[0], edge[1]])
+                key = (edge[1], -degree[edge[0]]) if shallow else edge[1]
+                add_to_heap_graph(fringe, [end_node, edge[0], key])
 
     return tree_edges, cost 
     
-def find_min_dijkstra(unmark, dist):
+def aux_heap_less(a, b, key, tie):
 
-    minim = math.inf
+    return key[a] < key[b] or (key[a] == key[b] and tie[a] < tie[b])
 
-    for i in range(len(unmark)):
-        node = unmark[i]
-        if dist[node] <= minim:
-            minim = dist[node]
-            minim_index = i
-            minim_node = node
+heap_less = njit(aux_heap_less, cache=True)
 
-    return minim_index, minim_node
+def aux_prim_heap_numba(indptr, indices, weights, s, shallow):
 
-def dijkstra(nodes, adj, s=0):
+    n = len(indptr) - 1
+    key = np.zeros(n, dtype=weights.dtype)
+    tie = np.zeros(n, dtype=np.int64)
+    if shallow:
+        tie = indptr[:-1] - indptr[1:]
 
-    mark = []
-    unmark = nodes.copy()
+    heap = np.empty(n, dtype=np.int64)
+    pos = np.full(n, -1, dtype=np.int64)
+    size_heap = 0
 
-    dist = [math.inf for _ in range(len(nodes))]
-    dist[s] = 0
+    visited = np.zeros(n, dtype=np.bool_)
+    pred = np.zeros(n, dtype=np.int64)
+    start = np.empty(max(n - 1, 0), dtype=np.int64)
+    end = np.empty(max(n - 1, 0), dtype=np.int64)
+    local_cost = np.empty(max(n - 1, 0), dtype=weights.dtype)
+    count = 0
 
-    pred = [[] for _ in range(len(nodes))]
-    pred[s].append(0)
+    end_node = s
+    visited[s] = True
 
-    while len(mark) < len(nodes):
+    while True:
 
-        minim_index, minim_node = find_min_dijkstra(unmark, dist) 
-        mark.append(minim_node)
-        unmark.pop(minim_index)
+        for k in range(indptr[end_node], indptr[end_node+1]):
 
-        for edge in adj[minim_node]:
-            end_node, edge_weight = edge
-            if end_node in unmark:
-                if dist[end_node] > dist[minim_node] + edge_weight:
-                    dist[end_node] = dist[minim_node]
-                    pred[end_node].append(minim_node)
+            trial_node = indices[k]
+            if visited[trial_node]:
+                continue
+
+            if pos[trial_node] == -1:
+                key[trial_node] = weights[k]
+                pred[trial_node] = end_node
+                i = size_heap
+                size_heap += 1
+            elif weights[k] < key[trial_node]:
+                key[trial_node] = weights[k]
+                pred[trial_node] = end_node
+                i = pos[trial_node]
             else:
                 continue
-    
+
+            # Arruma para cima
+            while i > 0 and heap_less(trial_node, heap[(i-1)//2], key, tie):
+                heap[i] = heap[(i-1)//2]
+                pos[heap[i]] = i
+                i = (i-1)//2
+            heap[i] = trial_node
+            pos[trial_node] = i
+
+        if size_heap == 0:
+            break
+
+        end_node = heap[0]
+        pos[end_node] = -1
+        size_heap -= 1
+
+        if size_heap != 0:
+
+            # Arruma para baixo
+            last = heap[size_heap]
+            i = 0
+            while 2*i + 1 <= size_heap - 1:
+                j = 2*i + 1
+                if j < size_heap - 1 and heap_less(heap[j+1], heap[j], key, tie):
+                    j += 1
+                if not heap_less(heap[j], last, key, tie):
+                    break
+                heap[i] = heap[j]
+                pos[heap[i]] = i
+                i = j
+            heap[i] = last
+            pos[last] = i
+
+        visited[end_node] = True
+        start[count] = pred[end_node]
+        end[count] = end_node
+        local_cost[count] = key[end_node]
+        count += 1
+
+    return start[:count], end[:count], local_cost[:count]
+
+prim_heap_numba = njit(aux_prim_heap_numba, cache=True)
+
+def prim_index_heap(nodes, adj, s=0, shallow=False):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    A função aplica o algoritmo de Prim para encontrar a árvore geradora mínima (AGM) do
+    grafo utilizando heap indexada por nó (index_heap). Em vez de inserir na heap todo arco
+    candidato e descartar os obsoletos ao extraí-los, como em prim_heap, cada nó fora da
+    árvore ocupa uma única posição na heap, com chave igual ao custo do arco mais barato
+    que o liga à árvore; quando um arco mais barato é encontrado, a chave é diminuída
+    (decrease_key). Assim, a heap nunca possui mais de n elementos e o custo total é
+    O(E log n).
+
+    No modo raso, a chave de cada nó j é o par (custo, -grau de j), tal como em prim_heap.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - adj : lista de adjacência (ou objeto da classe csr_graph) representando o grafo;
+
+    - s : identificador do nó de partida. Como padrão, s = 0, isto é, o primeiro nó de
+    nodes;
+
+    - shallow : valor booleano que condiciona o algoritmo de Prim a encontrar a AGM mais
+    rasa. Por padrão, False.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - tree_edges : lista de arestas da AGM;
+
+    - cost : custo total da AGM.
+
+    """
+
+    if shallow:
+        degree = aux_degree(adj)
+
+    n = len(nodes)
+    visited = [False for _ in range(n)]
+    pred = [None for _ in range(n)]
+    fringe = index_heap(n)
+
+    cost = 0
     tree_edges = []
-    for i in range(1, len(pred)):
-        beg_node = pred[i][0]
-        end_node = i
-        j = 0
-        while adj[beg_node][j][0] != end_node:
-            j += 1        
-        tree_edges.append([beg_node]+adj[beg_node][j])
+    end_node = s
+    visited[s] = True
 
+    while True:
 
-    return tree_edges
+        for trial_node, weight in adj[end_node]:
+            if visited[trial_node]:
+                continue
+            key = (weight, -degree[trial_node]) if shallow else weight
+            if trial_node not in fringe:
+                pred[trial_node] = end_node
+                fringe.insert(trial_node, key)
+            elif key < fringe.key[trial_node]:
+                pred[trial_node] = end_node
+                fringe.decrease_key(trial_node, key)
+
+        if len(fringe) == 0:
+            break
+
+        end_node, key = fringe.extract_min()
+        local_cost = key[0] if shallow else key
+        visited[end_node] = True
+
+        tree_edges.append([int(pred[end_node]), int(end_node), local_cost])
+        cost += local_cost
 
-def direct_out_tree(nodes, adj, s=0):
+    return tree_edges, cost
+
+def prim_dense(matrix, s=0):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    A função aplica o algoritmo de Prim diretamente sobre a matriz de dados, tomando
+    como grafo implícito o grafo de similaridade completo (custo de (i, j) igual ao
+    número de entradas distintas entre as linhas i e j). Nenhuma aresta ou lista de
+    adjacência é construída: mantém-se apenas um vetor com a menor distância de cada
+    nó não visitado à árvore e o respectivo predecessor. A cada passo, adiciona-se o
+    nó de menor distância e calculam-se, sob demanda, as distâncias dos nós restantes
+    ao nó recém-adicionado.
+
+    O custo é O(n² m) em tempo e O(n m) em memória, dispensando a heap.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - matrix : lista de listas ou matriz numpy, em que cada linha corresponde a um dado;
+
+    - s : nó de partida. Como padrão, s = 0, isto é, a primeira linha de matrix.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - tree_edges : lista de arestas da AGM;
+
+    - cost : custo total da AGM.
+
+    """
+
+    matrix = np.asarray(matrix)
+    rows = matrix.shape[0]
+
+    remain = np.delete(np.arange(rows), s)
+    best = (matrix[remain] != matrix[s]).sum(axis=1)
+    pred = np.full(rows - 1, s)
+    size_remain = rows - 1
+
+    cost = 0
+    tree_edges = []
+
+    while size_remain != 0:
+
+        k = int(np.argmin(best[:size_remain]))
+        start_node, end_node, local_cost = int(pred[k]), int(remain[k]), int(best[k])
+
+        tree_edges.append([start_node, end_node, local_cost])
+        cost += local_cost
+
+        # Remove-se o nó adicionado trocando-o pelo último dos nós restantes
+        size_remain -= 1
+        remain[k], best[k], pred[k] = remain[size_remain], best[size_remain], pred[size_remain]
+
+        local_dist = (matrix[remain[:size_remain]] != matrix[end_node]).sum(axis=1)
+        update = local_dist < best[:size_remain]
+        best[:size_remain][update] = local_dist[update]
+        pred[:size_remain][update] = end_node
+
+    return tree_edges, cost
+
+def dijkstra(nodes, adj, s=0):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    A função aplica o algoritmo de Dijkstra para encontrar a árvore de caminhos mínimos
+    a partir de um ou mais nós de origem, em grafo de custos não negativos. A cada passo,
+    retira-se da heap indexada (index_heap) o nó de menor distância provisória, que passa
+    a ser definitivo, e relaxam-se os arcos que dele partem: caso dist[i] + custo(i, j) 
+    seja menor que dist[j], atualizam-se a distância e o predecessor de j, e a chave de j 
+    na heap é diminuída. O custo total é O((V+E) log V).
+
+    Com várias origens, todas partem com distância zero, e a distância de cada nó é a 
+    distância até a origem mais próxima.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - adj : lista de adjacência (ou objeto da classe csr_graph) representando o grafo;
+
+    - s : nó de origem, ou lista de nós de origem. Como padrão, s = 0.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - tree_edges : lista de arestas da árvore de caminhos mínimos;
+
+    - dist : lista de distâncias de cada nó à origem (math.inf caso não seja alcançado).
+
+    """
+
+    n = len(nodes)
+    sources = [s] if isinstance(s, (int, np.integer)) else list(s)
+
+    dist = [math.inf for _ in range(n)]
+    pred = [None for _ in range(n)]
+    pred_weight = [None for _ in range(n)]
+    mark = [False for _ in range(n)]
+    fringe = index_heap(n)
+
+    for source in sources:
+        if source not in fringe:
+            dist[source] = 0
+            fringe.insert(source, 0)
+
+    while len(fringe) != 0:
+
+        node, node_dist = fringe.extract_min()
+        mark[node] = True
+
+        for end_node, edge_weight in adj[node]:
+
+            if mark[end_node]:
+                continue
+
+            trial_dist = node_dist + edge_weight
+            if trial_dist < dist[end_node]:
+                dist[end_node] = trial_dist
+                pred[end_node] = node
+                pred_weight[end_node] = edge_weight
+                if end_node in fringe:
+                    fringe.decrease_key(end_node, trial_dist)
+                else:
+                    fringe.insert(end_node, trial_dist)
+
+    tree_edges = [[pred[node], node, pred_weight[node]] for node in range(n) if pred[node] is not None]
+
+    return tree_edges, dist
+
+def aux_direct_out_tree_numba(indptr, indices, weights, s):
+
+    n = len(indptr) - 1
+    mark = np.zeros(n, dtype=np.bool_)
+    queue = np.empty(n, dtype=np.int64)
+    pred = np.zeros(n, dtype=np.int64)
+    start = np.empty(max(n - 1, 0), dtype=np.int64)
+    end = np.empty(max(n - 1, 0), dtype=np.int64)
+    weight = np.empty(max(n - 1, 0), dtype=weights.dtype)
+
+    mark[s] = True
+    queue[0] = s
+    head, tail, count = 0, 1, 0
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        for k in range(indptr[node], indptr[node+1]):
+            trial_node = indices[k]
+            if not mark[trial_node]:
+                mark[trial_node] = True
+                queue[tail] = trial_node
+                tail += 1
+                pred[trial_node] = node
+                start[count] = node
+                end[count] = trial_node
+                weight[count] = weights[k]
+                count += 1
+
+    return start[:count], end[:count], weight[:count], pred
+
+direct_out_tree_numba = njit(aux_direct_out_tree_numba, cache=True)
+
+def direct_out_tree(nodes, adj, s=0, engine="python"):
 
     """
     _________________
@@ -334,17 +821,23 @@ def direct_out_tree(nodes, adj, s=0):
     _________________
 
     Função para gerar, a partir de uma árvore não direcionada e um nó raiz, árvore 
-    direcionada para fora.
+    direcionada para fora. A árvore é percorrida em largura, com fila dupla (deque), 
+    em O(V+E).
 
     __________________
     --- Argumentos ---
     __________________
 
-    - nodes : lista de nós (enumerados);
+    - nodes : lista de nós (enumerados ou com nome);
 
-    - adj : lista de adjacência representando o grafo;
+    - adj : lista de adjacência (ou objeto da classe csr_graph) representando o grafo;
+
+    - s : nó (número do nó) raiz da árvore direcionada. Qualquer nó é aceito, como o
+    centroide (centroid_search) ou a raiz ponderada por acessos (weighted_root_search);
 
-    - s : nó (número do nó) raiz da árvore direcionada;
+    - engine : "python" ou "numba". No segundo caso, a busca é feita pelo núcleo
+    compilado direct_out_tree_numba sobre a adjacência em formato CSR. Por padrão, 
+    "python".
 
     ______________
     --- Saídas ---
@@ -356,16 +849,23 @@ def direct_out_tree(nodes, adj, s=0):
 
     """
 
-    mark = set([s])
-    List = [s]
+    if engine == "numba":
+        indptr, indices, weights = aux_csr_arrays(adj)
+        start, end, weight, pred = direct_out_tree_numba(indptr, indices, weights, s)
+        new_edges = [list(edge) for edge in zip(start.tolist(), end.tolist(), weight.tolist())]
+        return new_edges, pred.tolist()
+
+    mark = [False for _ in range(len(nodes))]
+    mark[s] = True
+    List = deque([s])
     pred = [0 for _ in range(len(nodes))]
     new_edges = []
 
     while len(List) != 0:
-        node=List.pop(0)
+        node=List.popleft()
         for trial_node, weitgh in adj[node]:
-            if trial_node not in mark:
-                mark.add(trial_node)
+            if not mark[trial_node]:
+                mark[trial_node] = True
                 List.append(trial_node)
                 pred[trial_node] = node
                 new_edges.append([node, trial_node, weitgh])
@@ -1,3 +1,136 @@
+import json
+import struct
+import numpy as np
+
+class node_map():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para internalização dos nomes dos nós. Os nós, enumerados ou com nome 
+    (qualquer objeto "hashable"), recebem uma única vez, na construção, identificadores 
+    inteiros consecutivos (int32) de 0 a N-1, dados pela posição em nodes. Caso os nós já
+    sejam 0, 1, ..., N-1, as traduções são a identidade.
+
+    Os nomes são traduzidos apenas na fronteira das estruturas de representação: os 
+    algoritmos recebem (inclusive os nós de partida s e destino t) e retornam somente 
+    identificadores. Para construir uma estrutura a partir da saída de um algoritmo, 
+    usa-se encoded=True; para recuperar os nomes, decode e decode_edges.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - encoded : valor booleano que indica se os nós a traduzir já são dados por seus
+    identificadores. Nesse caso, id, encode e encode_edges são a identidade, e os nomes
+    servem apenas à saída (decode, decode_edges e display). Por padrão, False.
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - N : número de nós;
+
+    - labels : vetor numpy (object) com o nome de cada identificador;
+
+    - index : dicionário que associa cada nome ao seu identificador;
+
+    - identity : valor booleano que indica se os nós já são 0, 1, ..., N-1;
+
+    - encoded : valor booleano que indica se os nós a traduzir já são identificadores.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : constrói labels, index e identity;
+
+    - id : retorna o identificador de um nó;
+
+        * Argumentos: 
+
+            - label : nome do nó.
+
+    - encode / decode : traduzem, de uma só vez, uma sequência de nomes em vetor de
+    identificadores (int32), e vice-versa;
+
+        * Argumentos: 
+
+            - labels / ids : sequência de nomes / identificadores.
+
+    - encode_edges / decode_edges : traduzem os nós de uma lista de arcos (ou tupla 
+    de vetores (src, dst, weight)), preservando os custos.
+
+        * Argumentos: 
+
+            - edges : lista de arcos ou tupla de vetores.
+
+    """
+
+    def __init__(self, nodes, encoded=False):
+
+        self.N = len(nodes)
+        self.labels = np.fromiter(nodes, dtype=object, count=self.N)
+        self.index = {label: i for i, label in enumerate(nodes)}
+
+        if len(self.index) != self.N:
+            raise ValueError("Os nós devem ter nomes distintos.")
+
+        self.identity = all(isinstance(label, (int, np.integer)) and not isinstance(label, bool)
+                            and label == i for i, label in enumerate(nodes))
+        self.encoded = encoded
+
+    def id(self, label):
+
+        if self.identity or self.encoded:
+            return label
+
+        return self.index[label]
+
+    def encode(self, labels):
+
+        if self.identity or self.encoded:
+            return np.asarray(labels, dtype=np.int32)
+
+        index = self.index
+
+        return np.fromiter((index[label] for label in labels), dtype=np.int32, count=len(labels))
+
+    def decode(self, ids):
+
+        if self.identity:
+            return ids
+
+        return self.labels[ids]
+
+    def encode_edges(self, edges):
+
+        if self.identity or self.encoded:
+            return edges
+
+        if isinstance(edges, tuple):
+            return (self.encode(edges[0]), self.encode(edges[1])) + tuple(edges[2:])
+
+        index = self.index
+
+        return [[index[edge[0]], index[edge[1]]] + list(edge[2:]) for edge in edges]
+
+    def decode_edges(self, edges):
+
+        if self.identity:
+            return edges
+
+        if isinstance(edges, tuple):
+            return (self.decode(edges[0]), self.decode(edges[1])) + tuple(edges[2:])
+
+        labels = self.labels
+
+        return [[labels[edge[0]], labels[edge[1]]] + list(edge[2:]) for edge in edges]
+
 class incid_matrix():
 
     """ 
@@ -23,6 +156,10 @@ class incid_matrix():
     - sort : valor booleano que, quando verdadeiro, ordena
     os arcos com relação aos seus custos;
 
+    - encoded : valor booleano que indica se os nós de edges já são dados por seus
+    identificadores (por exemplo, arestas retornadas pelos algoritmos). Por padrão, 
+    False.
+
     _________________
     --- Atributos ---
     _________________
@@ -47,7 +184,11 @@ class incid_matrix():
 
     - cost : lista de custos;
 
-    - mat : matriz de incidência.
+    - node_map : objeto da classe node_map() com os identificadores
+    inteiros dos nós;
+
+    - mat : matriz de incidência, cuja linha i corresponde ao nó de 
+    identificador i.
 
     _______________
     --- Métodos ---
@@ -63,7 +204,7 @@ class incid_matrix():
 
     """
 
-    def __init__(self, nodes, edges, directed=True, sort=True):
+    def __init__(self, nodes, edges, directed=True, sort=True, encoded=False):
         
         self.nodes = nodes
         self.N = len(nodes)
@@ -77,6 +218,7 @@ class incid_matrix():
             if sort:
                 self.edges.sort(key=aux_sort)
             self.cost = [edge[2] for edge in edges]
+        self.node_map = node_map(nodes, encoded)
         self.mat = None
     
     def construct_matrix(self):
@@ -89,9 +231,10 @@ class incid_matrix():
         else:
             val1 = 1
         
+        edges = self.node_map.encode_edges(self.edges)
         for i in range(self.E):
-            self.mat[self.edges[i][0]][i] = val0
-            self.mat[self.edges[i][1]][i] = val1
+            self.mat[edges[i][0]][i] = val0
+            self.mat[edges[i][1]][i] = val1
 
         return 
 
@@ -107,6 +250,160 @@ class incid_matrix():
 
         return 
 
+class sparse_incid_matrix():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para representação de grafos por matriz de incidência esparsa. Como cada
+    coluna (arco) da matriz de incidência possui exatamente duas entradas não nulas,
+    armazenam-se apenas as 2E entradas, em formato COO (vetores coo_row, coo_col e coo_val). As
+    entradas do arco e ocupam as posições 2e e 2e+1, de modo que o acesso a uma coluna
+    é imediato (formato CSC implícito); para o acesso às linhas (nós), constrói-se 
+    também um índice por nó (row_ptr e row_order).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - edges : lista de arcos, em que cada elemento é
+    definido segundo o padrão:
+        [nó de partida, nó incidente, custo=opcional],
+    ou tupla de vetores (src, dst, weight);
+
+    - directed : valor booleano que indica o direcionamento,
+    ou não, do grafo;
+
+    - sort : valor booleano que, quando verdadeiro, ordena
+    os arcos com relação aos seus custos;
+
+    - encoded : valor booleano que indica se os nós de edges já são dados por seus
+    identificadores (por exemplo, arestas retornadas pelos algoritmos). Por padrão, 
+    False.
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - N : número de nós;
+
+    - src, dst : vetores de nós de partida e incidentes;
+
+    - E : número de arcos.
+
+    - directed : valor booleano que indica o direcionamento,
+    ou não, do grafo;
+
+    - weight : valor booleano que se o grafo é ponderado;
+
+    - sort : valor booleano que, quando verdadeiro, ordena
+    os arcos com relação aos seus custos;
+
+    - cost : vetor de custos;
+
+    - node_map : objeto da classe node_map() com os identificadores
+    inteiros dos nós;
+
+    - coo_row, coo_col, coo_val : vetores das entradas não nulas (COO);
+
+    - row_ptr, row_order : índice das entradas por nó, isto é, as entradas do
+    nó i são row_order[row_ptr[i]..row_ptr[i+1]-1].
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : inicializa atributos básicos, sendo eles
+    nodes, N, src, dst, E, directed, sort, weight e cost;
+
+    - construct_matrix : constrói matriz de incidência esparsa;
+
+    - column : retorna os nós e valores da coluna (arco) edge;
+
+        * Argumentos: 
+
+            - edge : índice do arco.
+
+    - row : retorna os arcos e valores da linha (nó) node;
+
+        * Argumentos: 
+
+            - node : nó (número do nó).
+
+    - to_dense : retorna matriz de incidência densa, como lista de listas;
+
+    - display : fornce vizualização da matriz de inciência, 
+    caso já tenha sido construída, via terminal.
+
+    """
+
+    def __init__(self, nodes, edges, directed=True, sort=True, encoded=False):
+
+        self.nodes = nodes
+        self.N = len(nodes)
+        self.directed = directed
+        self.weight = isinstance(edges, tuple) or len(edges[0]) != 2
+        self.node_map = node_map(nodes, encoded)
+        self.src, self.dst, cost = aux_edge_arrays(self.node_map.encode_edges(edges))
+        self.E = len(self.src)
+        if self.weight:
+            if sort:
+                order = np.argsort(cost, kind="stable")
+                self.src, self.dst, cost = self.src[order], self.dst[order], cost[order]
+            self.cost = cost
+        self.coo_row = None
+
+    def construct_matrix(self):
+
+        index_type = np.int32 if max(self.N, self.E) < 2**31 else np.int64
+
+        val1 = -1 if self.directed else 1
+
+        self.coo_row = np.column_stack((self.src, self.dst)).ravel().astype(index_type)
+        self.coo_col = np.repeat(np.arange(self.E, dtype=index_type), 2)
+        self.coo_val = np.tile(np.array([1, val1], dtype=np.int8), self.E)
+
+        self.row_order = np.argsort(self.coo_row, kind="stable").astype(index_type)
+        self.row_ptr = np.zeros(self.N+1, dtype=np.int64)
+        np.cumsum(np.bincount(self.coo_row, minlength=self.N), out=self.row_ptr[1:])
+
+        return
+
+    def column(self, edge):
+
+        return self.coo_row[2*edge:2*edge+2], self.coo_val[2*edge:2*edge+2]
+
+    def row(self, node):
+
+        entries = self.row_order[self.row_ptr[node]:self.row_ptr[node+1]]
+
+        return self.coo_col[entries], self.coo_val[entries]
+
+    def to_dense(self):
+
+        mat = np.zeros((self.N, self.E), dtype=np.int8)
+        mat[self.coo_row, self.coo_col] = self.coo_val
+
+        return mat.tolist()
+
+    def display(self):
+
+        if self.coo_row is None:
+            return print("Matriz de incidência ainda não foi construída.")
+
+        print("\n")
+        for lin in self.to_dense():
+            print(lin, "\n")
+        print("\n")
+
+        return
+
 def aux_sort(elem):
 
     """
@@ -155,6 +452,10 @@ class adj_list():
     - directed : valor booleano que indica o direcionamento,
     ou não, do grafo;
 
+    - encoded : valor booleano que indica se os nós de edges já são dados por seus
+    identificadores (por exemplo, arestas retornadas pelos algoritmos). Por padrão, 
+    False.
+
     _________________
     --- Atributos ---
     _________________
@@ -174,7 +475,10 @@ class adj_list():
 
     - weight : valor booleano que se o grafo é ponderado;
 
-    - adj : lista de adjacência.
+    - node_map : objeto da classe node_map() com os identificadores
+    inteiros dos nós;
+
+    - adj : lista de adjacência, indexada pelos identificadores dos nós.
 
     _______________
     --- Métodos ---
@@ -196,7 +500,7 @@ class adj_list():
 
     """
 
-    def __init__(self, nodes, edges, directed=True):
+    def __init__(self, nodes, edges, directed=True, encoded=False):
 
         self.nodes = nodes
         self.N = len(nodes)
@@ -207,6 +511,7 @@ class adj_list():
             self.weight = False
         else:
             self.weight = True
+        self.node_map = node_map(nodes, encoded)
         self.adj = None
     
     def add_edge(self, edge):
@@ -216,10 +521,13 @@ class adj_list():
         else:
             cost = edge[2]
         
-        self.adj[edge[0]].append([edge[1], cost])
+        node0 = self.node_map.id(edge[0])
+        node1 = self.node_map.id(edge[1])
+
+        self.adj[node0].append([node1, cost])
         
         if not self.directed:
-            self.adj[edge[1]].append([edge[0], cost])  # Undirected
+            self.adj[node1].append([node0, cost])  # Undirected
     
     def construct_adj_list(self):
 
@@ -236,14 +544,432 @@ class adj_list():
             return print("Lista de adjacência ainda não foi construída.")
 
         print("\n")
+        labels = self.node_map.labels
         for i in range(len(self.adj)):
-            print(f"{i}: ", end="")
+            print(f"{labels[i]}: ", end="")
             for j in self.adj[i]:
-                print(j, end=" ")
+                print([labels[j[0]], j[1]], end=" ")
             print()
         
         return
 
+def aux_edge_arrays(edges):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para obter os vetores (src, dst, weight) de um conjunto de arestas,
+    fornecido como lista de arestas [nó de partida, nó incidente, custo=opcional] ou como
+    tupla de vetores (src, dst, weight), por exemplo, a saída de edges_constructor_block.
+    Arestas sem custo recebem custo 0.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - edges : lista de arestas ou tupla (src, dst, weight).
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - src : vetor de nós de partida;
+
+    - dst : vetor de nós incidentes;
+
+    - weight : vetor de custos.
+
+    """
+
+    if isinstance(edges, tuple):
+        src, dst, weight = edges
+        return np.asarray(src), np.asarray(dst), np.asarray(weight)
+
+    edges = np.asarray(edges)
+    if edges.ndim != 2:
+        edges = edges.reshape(-1, 3)
+
+    src, dst = edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64)
+    if edges.shape[1] == 2:
+        return src, dst, np.zeros(len(edges), dtype=np.int64)
+
+    return src, dst, edges[:, 2]
+
+class csr_graph():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para representação de grafos em formato CSR (compressed sparse row): os 
+    vizinhos do nó i ocupam as posições indptr[i]..indptr[i+1]-1 dos vetores indices e
+    weights. Diferente de adj_list, não se cria um objeto por vizinho, apenas três 
+    vetores numpy, construídos de uma só vez a partir dos vetores de arestas 
+    (ordenação estável pelo nó de partida e contagem por nó). A ordem dos vizinhos de 
+    cada nó é a mesma de adj_list.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - edges : lista de arcos, em que cada elemento é
+    definido segundo o padrão:
+        [nó de partida, nó incidente, custo=opcional],
+    ou tupla de vetores (src, dst, weight);
+
+    - directed : valor booleano que indica o direcionamento,
+    ou não, do grafo;
+
+    - encoded : valor booleano que indica se os nós de edges já são dados por seus
+    identificadores (por exemplo, arestas retornadas pelos algoritmos). Por padrão, 
+    False.
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - nodes : lista de nós (enumerados ou com nome);
+
+    - N : número de nós;
+
+    - src, dst, cost : vetores de arcos;
+
+    - E : número de arcos.
+
+    - directed : valor booleano que indica o direcionamento,
+    ou não, do grafo;
+
+    - node_map : objeto da classe node_map() com os identificadores
+    inteiros dos nós;
+
+    - indptr : vetor (int64) de N+1 posições iniciais;
+
+    - indices : vetor de nós vizinhos;
+
+    - weights : vetor de custos dos vizinhos.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : inicializa atributos básicos, sendo eles
+    nodes, N, src, dst, cost, E e directed;
+
+    - construct_csr : constrói os vetores indptr, indices e weights;
+
+    - neighbors : retorna vistas (sem cópia) dos vizinhos e custos de um nó;
+
+        * Argumentos: 
+
+            - node : nó (número do nó).
+
+    - degree : retorna vetor com o número de vizinhos de cada nó;
+
+    - __getitem__ : permite percorrer os vizinhos de um nó como em adj_list, isto é,
+    "for node, cost in graph[i]", de modo que a instância possa ser passada no lugar
+    de adj a prim_heap e direct_out_tree (e, como graph, a label_node_search);
+
+    - display : fornce vizualização do grafo, caso já tenha sido construído,
+    via terminal.
+
+    """
+
+    def __init__(self, nodes, edges, directed=True, encoded=False):
+
+        self.nodes = nodes
+        self.N = len(nodes)
+        self.node_map = node_map(nodes, encoded)
+        self.src, self.dst, self.cost = aux_edge_arrays(self.node_map.encode_edges(edges))
+        self.E = len(self.cost)
+        self.directed = directed
+        self.indptr = None
+        self.indices = None
+        self.weights = None
+
+    def construct_csr(self):
+
+        if self.directed:
+            src, dst, cost = self.src, self.dst, self.cost
+        else:
+            # Arcos intercalados (i, j), (j, i), de modo a manter a ordem de adj_list
+            src = np.column_stack((self.src, self.dst)).ravel()
+            dst = np.column_stack((self.dst, self.src)).ravel()
+            cost = np.repeat(self.cost, 2)
+
+        order = np.argsort(src, kind="stable")
+        self.indices = dst[order]
+        self.weights = cost[order]
+
+        self.indptr = np.zeros(self.N+1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=self.N), out=self.indptr[1:])
+
+        return
+
+    @property
+    def adj(self):
+
+        return self
+
+    def neighbors(self, node):
+
+        beg, end = self.indptr[node], self.indptr[node+1]
+
+        return self.indices[beg:end], self.weights[beg:end]
+
+    def degree(self):
+
+        return np.diff(self.indptr)
+
+    def __len__(self):
+
+        return self.N
+
+    def __getitem__(self, node):
+
+        indices, weights = self.neighbors(node)
+
+        return zip(indices.tolist(), weights.tolist())
+
+    def display(self):
+
+        if self.indptr is None:
+            return print("Grafo CSR ainda não foi construído.")
+
+        labels = self.node_map.labels
+        print("\n")
+        for i in range(self.N):
+            print(f"{labels[i]}: ", end="")
+            for j in self[i]:
+                print([labels[j[0]], j[1]], end=" ")
+            print()
+
+        return
+
+def aux_degree(adj):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para obter o número de vizinhos de cada nó.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - adj : lista de adjacência ou objeto da classe csr_graph.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - degree : lista com o número de vizinhos de cada nó.
+
+    """
+
+    if isinstance(adj, csr_graph):
+        return adj.degree().tolist()
+
+    return [len(neighbors) for neighbors in adj]
+
+def aux_csr_arrays(adj):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para converter lista de adjacência em vetores no formato CSR
+    (compressed sparse row): os vizinhos do nó i ocupam as posições 
+    indptr[i]..indptr[i+1]-1 de indices e weights.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - adj : lista de adjacência, em que cada vizinho é dado por [nó, custo], ou
+    objeto da classe csr_graph (caso em que os vetores são retornados sem cópia).
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - indptr : vetor (int64) de n+1 posições iniciais;
+
+    - indices : vetor (int64) de nós vizinhos;
+
+    - weights : vetor de custos.
+
+    """
+
+    if isinstance(adj, csr_graph):
+        return adj.indptr, adj.indices, adj.weights
+
+    degree = np.array([len(neighbors) for neighbors in adj], dtype=np.int64)
+    indptr = np.zeros(len(adj)+1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+
+    pairs = np.array([pair for neighbors in adj for pair in neighbors]).reshape(-1, 2)
+
+    return indptr, pairs[:, 0].astype(np.int64), pairs[:, 1]
+
+GRAPH_MAGIC = b"NFPGRAPH"
+GRAPH_VERSION = 1
+GRAPH_HEADER = struct.Struct("<8sIIQQ8s8s8s")
+GRAPH_ALIGN = 64
+
+def aux_align(offset):
+
+    return -(-offset//GRAPH_ALIGN)*GRAPH_ALIGN
+
+def save_graph(path, graph, directed=True):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para salvar conjunto de arestas em arquivo binário versionado. O arquivo é
+    composto por um cabeçalho (identificador, versão, direcionamento, N, E e tipos dos
+    vetores) seguido dos vetores src, dst e weight em formato bruto, cada um alinhado
+    em 64 bytes, de modo que possam ser abertos por np.memmap (load_graph).
+
+    As arestas são sempre salvas pelos identificadores inteiros dos nós (node_map). 
+    Caso os nós tenham nome, os nomes são gravados em um bloco final (lista JSON em 
+    UTF-8, também alinhado em 64 bytes), indicado no campo de flags do cabeçalho.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - path : caminho do arquivo;
+
+    - graph : objeto das classes adj_list, incid_matrix, csr_graph ou
+    sparse_incid_matrix, ou tupla de vetores (src, dst, weight). Os nomes dos nós 
+    devem ser representáveis em JSON (textos, números, booleanos ou None);
+
+    - directed : direcionamento do grafo, usado apenas quando graph é uma tupla.
+    Por padrão, True.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    None.
+
+    """
+
+    if isinstance(graph, tuple):
+        src, dst, weight = aux_edge_arrays(graph)
+        num_nodes = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        labels = None
+    else:
+        directed = graph.directed
+        num_nodes = graph.N
+        labels = None if graph.node_map.identity else graph.node_map.labels.tolist()
+        if isinstance(graph, (csr_graph, sparse_incid_matrix)):
+            src, dst, weight = graph.src, graph.dst, getattr(graph, "cost", np.zeros(graph.E, dtype=np.int64))
+        else:
+            src, dst, weight = aux_edge_arrays(graph.node_map.encode_edges(graph.edges))
+
+    index_type = np.dtype("<i4") if num_nodes < 2**31 else np.dtype("<i8")
+    arrays = [np.ascontiguousarray(src, dtype=index_type),
+              np.ascontiguousarray(dst, dtype=index_type),
+              np.ascontiguousarray(weight, dtype=np.asarray(weight).dtype.newbyteorder("<"))]
+
+    if labels is not None:
+        try:
+            block = json.dumps(labels)
+        except TypeError:
+            block = None
+        if block is None or json.loads(block) != labels:
+            raise ValueError("Os nomes dos nós não podem ser representados em JSON.")
+        block = block.encode("utf-8")
+
+    flags = int(bool(directed)) | (2 if labels is not None else 0)
+    header = GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, flags, num_nodes, len(arrays[0]),
+                               *[array.dtype.str.encode() for array in arrays])
+
+    with open(path, "wb") as file:
+        file.write(header)
+        for array in arrays:
+            file.write(bytes(aux_align(file.tell()) - file.tell()))
+            file.write(array.tobytes())
+        if labels is not None:
+            file.write(bytes(aux_align(file.tell()) - file.tell()))
+            file.write(block)
+
+    return
+
+def load_graph(path):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para abrir conjunto de arestas salvo por save_graph. Os vetores são mapeados
+    em memória (np.memmap, somente leitura), de modo que o arquivo é aberto 
+    instantaneamente e os dados são lidos do disco apenas quando acessados. A tupla 
+    retornada pode ser passada diretamente a kruskal (engine="numba"), boruvka,
+    csr_graph e sparse_incid_matrix.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - path : caminho do arquivo.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - edges : tupla de vetores (src, dst, weight) mapeados em memória;
+
+    - N : número de nós;
+
+    - directed : valor booleano que indica o direcionamento do grafo;
+
+    - labels : lista com o nome de cada identificador, ou None caso os nós salvos 
+    sejam enumerados (0, 1, ..., N-1).
+
+    """
+
+    with open(path, "rb") as file:
+        header = file.read(GRAPH_HEADER.size)
+
+    if len(header) != GRAPH_HEADER.size or header[:len(GRAPH_MAGIC)] != GRAPH_MAGIC:
+        raise ValueError(f"{path} não é um arquivo de grafo válido.")
+
+    magic, version, flags, num_nodes, num_edges, *types = GRAPH_HEADER.unpack(header)
+    if version != GRAPH_VERSION:
+        raise ValueError(f"Versão {version} do arquivo de grafo não é suportada.")
+
+    edges = []
+    offset = GRAPH_HEADER.size
+    for dtype in types:
+        dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        offset = aux_align(offset)
+        if num_edges == 0:
+            edges.append(np.empty(0, dtype=dtype))
+        else:
+            edges.append(np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(num_edges,)))
+        offset += num_edges*dtype.itemsize
+
+    labels = None
+    if flags & 2:
+        with open(path, "rb") as file:
+            file.seek(aux_align(offset))
+            labels = json.loads(file.read().decode("utf-8"))
+
+    return tuple(edges), num_nodes, bool(flags & 1), labels
+
 ############################################
 ### Exemplo de construção e vizualização ###
 ############################################
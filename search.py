@@ -1,3 +1,6 @@
+import numpy as np
+from collections import deque
+from numba import njit
 from net_represent import *
 
 def label_node_search(graph, s, t=None, search="breadth"):
@@ -14,11 +17,16 @@ def label_node_search(graph, s, t=None, search="breadth"):
     para todos os nós marcados, até que não haja nenhum nó marcado com arcos
     admissíveis. Outra opção para o encerramento da função é alcançar nó objetivo t.
 
+    Cada nó mantém um cursor (iterador) sobre seus vizinhos, de modo que, ao ser 
+    revisitado, a varredura continua de onde parou; e a lista de nós marcados é uma
+    fila dupla (deque), com remoção em O(1) em ambas as pontas. Assim, cada arco é 
+    examinado uma única vez e a busca custa O(V+E).
+
     __________________
     --- Argumentos ---
     __________________
 
-    - graph : objeto da classe adj_list() representando grafo a ser percorrido;
+    - graph : objeto da classe adj_list() ou csr_graph() representando grafo a ser percorrido;
 
     - s : nó (número do nó) de partida;
 
@@ -35,25 +43,32 @@ def label_node_search(graph, s, t=None, search="breadth"):
     
     """
 
-    mark = set([s])
-    List = [s]
+    mark = [False for _ in range(graph.N)]
+    mark[s] = True
+    List = deque([s])
+    cursor = [None for _ in range(graph.N)]
     pred = [None for _ in range(graph.N)]
 
     if search == "breadth":
         search_order = 0
+        pop = List.popleft
     else: # == "depth search"
         search_order = -1
+        pop = List.pop
 
     while len(List) != 0:
 
         node = List[search_order]
         flag = False
 
-        for edge in graph.adj[node]:
+        if cursor[node] is None:
+            cursor[node] = iter(graph.adj[node])
+
+        for edge in cursor[node]:
 
             trial_node = edge[0]
 
-            if trial_node in mark:
+            if mark[trial_node]:
                 continue
             else:
                 flag = True
@@ -61,106 +76,197 @@ def label_node_search(graph, s, t=None, search="breadth"):
        
         if flag:
 
-            mark.add(trial_node)
+            mark[trial_node] = True
             List.append(trial_node)
             pred[trial_node] = node
 
             if trial_node == t:
                 return pred
         else:
-            List.pop(search_order)
+            pop()
 
     return pred
 
-def descend_search(adj, pred, curr_node, descend, centroid=None):
+def label_node_search_level(graph, s, t=None):
 
     """
     _________________
     --- Descrição ---
     _________________
 
-    Função recursiva para calcular o número de descendentes dos nós integrantes
-    de uma árvore. 
-    
-    O algoritmo pode ser descrito da seguinte maneira: dado um nó,
-    são varridos todos os nós a quem é ligado; à cada nó filho encontrado, a 
-    busca por descendente é recursivamente chamada; cada chamada da função finaliza 
-    apenas quando se alcança um nó que possui apenas ligação com seu antecessor,
-    então seu número de descendentes é igual a 1; o nó original tem
-    (número de descendentes) = (número de descendentes de seus filhos) + 1, logo
-    à cada "volta" das chamadas recursivas atualiza-se o número de descentendes do
-    nó atual como (número de descendentes de seus filhos) + 1.
-
-    Ao longo da busca, mantém-se controle sobre os nós para checar se o centroide
-    - primeiro nó o qual atinge um número de descendentes maior ou igual à metade
-    do número de nós da árvore - já foi encontrado. Em caso afirmativo, não são
-    aceitos nós que superam essa condição.
+    Função que implementa a busca em largura por níveis (level-synchronous) sobre a
+    adjacência em formato CSR. Em vez de marcar um nó por vez, expande-se um nível 
+    inteiro de uma só vez com o numpy: reúnem-se os vizinhos de todos os nós da 
+    fronteira, descartam-se os já marcados, e cada novo nó recebe como predecessor o
+    primeiro nó da fronteira que o alcança. A nova fronteira é o conjunto de nós 
+    recém-marcados. A busca se encerra ao esgotar a fronteira ou, caso t seja dado, 
+    ao fim do nível em que t é alcançado.
+
+    A saída tem o mesmo formato de label_node_search.
 
     __________________
     --- Argumentos ---
     __________________
 
-    - adj : lista de adjacência da árvore;
+    - graph : objeto da classe adj_list() ou csr_graph() representando grafo a ser percorrido;
+
+    - s : nó (número do nó) de partida;
+
+    - t : nó (número do nó) de destino. Por padrão, None.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - pred : lista de predecessores de cada nó do grafo ao longo do caminho encontrado.
+    
+    """
 
-    - pred : lista de predecessor para cada nó;
+    indptr, indices, weights = aux_csr_arrays(graph.adj)
+
+    pred = np.full(graph.N, -1, dtype=np.int64)
+    mark = np.zeros(graph.N, dtype=bool)
+    mark[s] = True
+    frontier = np.array([s], dtype=np.int64)
+
+    while len(frontier) != 0:
+
+        beg = indptr[frontier]
+        count = indptr[frontier+1] - beg
+        total = int(count.sum())
+        if total == 0:
+            break
+
+        # Posições, em indices, dos vizinhos de cada nó da fronteira
+        position = np.repeat(beg - np.cumsum(count) + count, count) + np.arange(total)
+        trial_nodes = indices[position]
+        parents = np.repeat(frontier, count)
+
+        new = ~mark[trial_nodes]
+        trial_nodes, first = np.unique(trial_nodes[new], return_index=True)
+
+        pred[trial_nodes] = parents[new][first]
+        mark[trial_nodes] = True
+        frontier = trial_nodes
+
+        if t is not None and mark[t]:
+            break
+
+    return [None if node < 0 else node for node in pred.tolist()]
+
+def aux_centroid_search_numba(indptr, indices, s):
+
+    num_nodes = len(indptr) - 1
+    order = np.empty(num_nodes, dtype=np.int64)
+    pred = np.full(num_nodes, -1, dtype=np.int64)
+    descend = np.ones(num_nodes, dtype=np.int64)
+    max_child = np.zeros(num_nodes, dtype=np.int64)
+
+    order[0] = s
+    pred[s] = s
+    head, tail = 0, 1
+
+    while head < tail:
+        node = order[head]
+        head += 1
+        for k in range(indptr[node], indptr[node+1]):
+            next_node = indices[k]
+            if pred[next_node] == -1:
+                pred[next_node] = node
+                order[tail] = next_node
+                tail += 1
+
+    # Ordem reversa da busca em largura: todo nó aparece depois de seus filhos
+    for k in range(tail - 1, 0, -1):
+        node = order[k]
+        descend[pred[node]] += descend[node]
+        max_child[pred[node]] = max(max_child[pred[node]], descend[node])
+
+    # Mesma regra (e mesmo desempate, na ordem da busca) de centroid_search
+    centroid = s
+    min_comp = tail
+    for k in range(tail):
+        node = order[k]
+        max_comp = max(tail - descend[node], max_child[node])
+        if max_comp < min_comp:
+            centroid = node
+            min_comp = max_comp
 
-    - curr_node : nó (número do nó) em análise;
+    return centroid
 
-    - descend : lista do número de descendentes para cada nó;
+centroid_search_numba = njit(aux_centroid_search_numba, cache=True)
 
-    - centroid : nó (número do nó) centroide. Caso não tenha sido encontrado
-    centroid = None.
+def tree_order(adj, s=0):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para percorrer uma árvore em largura, sem recursão, a partir de um nó raiz.
+    Na ordem obtida, todo nó aparece depois de seu predecessor; logo, percorrê-la de 
+    trás para frente equivale a percorrer a árvore em pós-ordem (filhos antes dos pais).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - adj : lista de adjacência (ou objeto da classe csr_graph) da árvore;
+
+    - s : nó (número do nó) raiz. Por padrão, 0.
 
     ______________
     --- Saídas ---
     ______________
 
-    - centroid : nó (número do nó) centroide. Caso não tenha sido encontrado
-    centroid = None.
+    - order : lista de nós na ordem da busca em largura;
+
+    - pred : lista de predecessores de cada nó (None para a raiz e para nós não 
+    alcançados).
 
     """
 
-    for edge in adj[curr_node]:
-        
-        next_node = edge[0]
-        
-        if next_node == pred[curr_node]:
-            if len(adj[curr_node]) > 1:
-                continue
-            else:
-                
-                descend[curr_node] += 1
-                return centroid
-        pred[next_node] = curr_node
-        
-        centroid = descend_search(adj, pred, next_node, descend, centroid)
-
-        descend[curr_node] += descend[next_node]
-    
-    descend[curr_node] += 1
+    pred = [None for _ in range(len(adj))]
+    mark = [False for _ in range(len(adj))]
+    mark[s] = True
+    order = [s]
 
-    if (descend[curr_node] >= len(adj)/2) and (centroid is None):
-        centroid = curr_node
+    for node in order:
+        for edge in adj[node]:
+            next_node = edge[0]
+            if not mark[next_node]:
+                mark[next_node] = True
+                pred[next_node] = node
+                order.append(next_node)
 
-    return centroid
+    return order, pred
 
-def centroid_search(adj, s=0):
+def centroid_search(adj, s=0, engine="python"):
 
     """
     _________________
     --- Descrição ---
     _________________
 
-    Função auxiliar para iniciar a busca por descendentes dado um nó de
-    partida em uma árvore. A função busca definir o centróde da árvore.
+    Função para definir o centróide da árvore, isto é, o nó cuja remoção minimiza o
+    tamanho da maior componente restante. A busca é iterativa: percorre-se a árvore em
+    largura a partir de s (tree_order) e, em ordem reversa, acumula-se o número de 
+    descendentes de cada nó no de seu predecessor. O tamanho da maior componente ao 
+    remover o nó v é max(n - descendentes de v, maior número de descendentes entre os 
+    filhos de v). O custo é O(n) e não há recursão, de modo que árvores profundas 
+    (como cadeias com 10^6 nós) não esbarram no limite de recursão do Python.
 
     ___________________
     --- Argummentos ---
     ___________________
 
-    - adj : lista de adjacência da árvore;
+    - adj : lista de adjacência (ou objeto da classe csr_graph) da árvore;
 
-    - s : nó (número do nó) de partida.
+    - s : nó (número do nó) de partida;
+
+    - engine : "python" ou "numba". No segundo caso, a busca é feita pelo núcleo
+    compilado centroid_search_numba sobre a adjacência em formato CSR.
+    Por padrão, "python".
 
     ______________
     --- Saídas ---
@@ -170,14 +276,236 @@ def centroid_search(adj, s=0):
     
     """
 
-    n = len(adj)
-    descend = [0 for _ in range(n)]
-    pred = [0 for _ in range(n)]
-    pred[0] = None
-    centroid = descend_search(adj, pred, s, descend)
+    if engine == "numba":
+        indptr, indices, _ = aux_csr_arrays(adj)
+        return int(centroid_search_numba(indptr, indices, s))
+
+    order, pred = tree_order(adj, s)
+    n = len(order)
+
+    descend = [1 for _ in range(len(adj))]
+    for node in reversed(order[1:]):
+        descend[pred[node]] += descend[node]
+
+    order = np.array(order)
+    parents = np.array([pred[node] for node in order[1:]], dtype=np.int64)
+    descend = np.array(descend)
+
+    max_child = np.zeros(len(adj), dtype=np.int64)
+    np.maximum.at(max_child, parents, descend[order[1:]])
+
+    max_comp = np.maximum(n - descend[order], max_child[order])
+    centroid = int(order[np.argmin(max_comp)])
 
     return centroid
 
+def weighted_root_search(adj, weights, s=0):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para definir a raiz da árvore que minimiza a soma de peso x profundidade 
+    dos nós, isto é, o custo esperado de reconstrução quando os pesos são frequências
+    de acesso de cada vetor. Percorre-se a árvore em largura a partir de s 
+    (tree_order); em ordem reversa, acumula-se o peso de cada subárvore (Wsub) e, na
+    ordem direta, obtém-se o custo de cada nó como raiz a partir do de seu predecessor:
+    custo(filho) = custo(pai) + W - 2 Wsub(filho), em que W é o peso total. O custo é
+    O(n) e não há recursão.
+
+    Com pesos iguais, a raiz obtida é uma mediana da árvore, que pode diferir do 
+    centroide de centroid_search.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - adj : lista de adjacência (ou objeto da classe csr_graph) da árvore;
+
+    - weights : vetor de pesos não negativos (por exemplo, número de consultas
+    observadas) de cada nó;
+
+    - s : nó (número do nó) de partida.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - root : nó (número do nó) raiz de menor custo.
+
+    """
+
+    order, pred = tree_order(adj, s)
+    weights = list(weights)
+
+    depth = [0 for _ in range(len(adj))]
+    for node in order[1:]:
+        depth[node] = depth[pred[node]] + 1
+
+    wsub = weights.copy()
+    for node in reversed(order[1:]):
+        wsub[pred[node]] += wsub[node]
+
+    total = wsub[s]
+    cost = [0 for _ in range(len(adj))]
+    cost[s] = sum(weights[node]*depth[node] for node in order)
+    for node in order[1:]:
+        cost[node] = cost[pred[node]] + total - 2*wsub[node]
+
+    root = min(order, key=lambda node: cost[node])
+
+    return root
+
+def tree_depth(pred, root=None):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para calcular a profundidade de cada nó de uma árvore dada pela lista de 
+    predecessores. O cálculo é vetorizado por
+    salto de ponteiros (pointer jumping): cada nó guarda um ancestral e a distância até
+    ele; a cada rodada, o ancestral passa a ser o ancestral do ancestral e as distâncias
+    se somam. São necessárias O(log n) rodadas, mesmo em árvores muito profundas.
+
+    Ordenar os nós pela profundidade (np.argsort(depth, kind="stable")) fornece uma
+    ordem em que todo nó aparece depois de seu predecessor.
+
+    A entrada de cada raiz deve ser negativa, o que permite tratar florestas. A saída de
+    direct_out_tree guarda pred[s] = 0; nesse caso, deve-se informar a raiz em root.
+    Caso os ponteiros formem um ciclo (raiz não informada), é lançado ValueError.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - pred : lista (ou vetor) de predecessores de cada nó;
+
+    - root : nó (número do nó) raiz da árvore, cuja entrada em pred é ignorada. Por
+    padrão, None, caso em que as raízes são apenas os nós com predecessor negativo.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - depth : vetor com a profundidade de cada nó.
+
+    """
+
+    nodes = np.arange(len(pred))
+    anc = np.array(pred, dtype=np.int64)
+    anc[anc < 0] = nodes[anc < 0]
+    if root is not None:
+        anc[root] = root
+    depth = (anc != nodes).astype(np.int64)
+
+    for _ in range(len(pred).bit_length() + 1):
+        if (anc[anc] == anc).all():
+            break
+        depth += depth[anc]
+        anc = anc[anc]
+    else:
+        raise ValueError("Os predecessores formam um ciclo: a entrada da raiz deve ser negativa.")
+
+    return depth
+
+class lca_index():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para consulta do menor ancestral comum (lowest common ancestor, LCA) de dois
+    nós de uma árvore enraizada, por saltos binários (binary lifting): up[k][v] é o 
+    ancestral de v 2^k níveis acima. A construção custa O(n log n), vetorizada, e cada
+    consulta, O(log n).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - pred : lista (ou vetor) de predecessores de cada nó, como a saída de 
+    direct_out_tree;
+
+    - root : nó (número do nó) raiz da árvore.
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - root : nó raiz;
+
+    - depth : vetor com a profundidade de cada nó;
+
+    - up : lista de vetores de ancestrais, up[k][v] sendo o ancestral 2^k níveis
+    acima de v (a raiz é ancestral de si mesma).
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : constrói depth e up;
+
+    - ancestor : retorna o ancestral de um nó h níveis acima;
+
+        * Argumentos: 
+
+            - node : nó (número do nó);
+
+            - h : número de níveis.
+
+    - query : retorna o menor ancestral comum de dois nós;
+
+        * Argumentos: 
+
+            - node0 : primeiro nó (número do nó);
+
+            - node1 : segundo nó (número do nó).
+
+    """
+
+    def __init__(self, pred, root):
+
+        self.root = root
+        self.depth = tree_depth(pred, root)
+
+        parent = np.array(pred, dtype=np.int64)
+        parent[root] = root
+        self.up = [parent]
+
+        for _ in range(max(int(self.depth.max(initial=0)).bit_length() - 1, 0)):
+            self.up.append(self.up[-1][self.up[-1]])
+
+    def ancestor(self, node, h):
+
+        k = 0
+        while h:
+            if h & 1:
+                node = int(self.up[k][node])
+            h >>= 1
+            k += 1
+
+        return node
+
+    def query(self, node0, node1):
+
+        depth = self.depth
+        if depth[node0] < depth[node1]:
+            node0, node1 = node1, node0
+
+        node0 = self.ancestor(node0, int(depth[node0] - depth[node1]))
+        if node0 == node1:
+            return node0
+
+        for k in range(len(self.up) - 1, -1, -1):
+            if self.up[k][node0] != self.up[k][node1]:
+                node0, node1 = int(self.up[k][node0]), int(self.up[k][node1])
+
+        return int(self.up[0][node0])
+
 ##########################################################
 ### Exemplo da aplicação do algoritmo dos Nós Marcados ###
 ##########################################################
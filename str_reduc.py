@@ -1,6 +1,7 @@
 import numpy as np
 import networkx as nx
-from numba import njit
+from collections import OrderedDict
+from numba import njit, prange, get_num_threads, set_num_threads, config
 import matplotlib.pyplot as plt
 from net_represent import *
 from min_span_tree import *
@@ -112,6 +113,36 @@ def find_diff(vec_0, vec_1):
 
     return opt_vec
 
+def aux_row_fix(vec):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para percorrer os consertos de uma linha da matriz de 
+    armazenamento ótima como pares (posição, valor). Linhas de checkpoint 
+    ([-1] + vetor completo) fornecem um conserto para cada posição.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - vec : linha (lista) da matriz de armazenamento ótima, exceto a do centroide.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - fix : iterador de pares (posição, valor).
+
+    """
+
+    if vec[0] == -1:
+        return enumerate(vec[1:])
+
+    return zip(vec[1::2], vec[2::2])
+
 def find_fix(opt_matrix, centroid, node):
 
     """
@@ -120,7 +151,7 @@ def find_fix(opt_matrix, centroid, node):
     _________________
 
     Função para definir os consertos necessários para reconstruir um vetor da 
-    matriz original.
+    matriz original. A busca para no centroide ou no primeiro checkpoint encontrado.
 
     __________________
     --- Argumentos ---
@@ -144,17 +175,90 @@ def find_fix(opt_matrix, centroid, node):
     vec = opt_matrix[node]
     pred_node = vec[0]
 
-    fix = tuple([])
-    while(pred_node != centroid):
-        if len(vec) > 1:
-            fix = tuple(vec[1:]) + fix
+    chunks = []
+    while(pred_node != centroid and pred_node != -1):
+        chunks.append(vec[1:])
         vec = opt_matrix[pred_node]
         pred_node = vec[0]
 
-    fix = tuple(vec[1:]) + fix
+    chunks.append([value for pair in aux_row_fix(vec) for value in pair])
+
+    fix = tuple(value for chunk in reversed(chunks) for value in chunk)
 
     return fix
 
+def find_delta(opt_matrix, lca, node0, node1):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para definir os consertos que transformam o vetor de node0 no vetor de 
+    node1, sem reconstruir nenhum dos dois. Percorre-se o caminho node0 -> LCA -> node1
+    na árvore de armazenamento: as posições alteradas entre o LCA e node1 recebem o 
+    valor de node1 (o conserto mais próximo de node1 prevalece); as posições alteradas
+    apenas entre o LCA e node0 recebem o valor do próprio LCA, obtido subindo a partir
+    dele somente até que todas essas posições sejam resolvidas (um checkpoint resolve
+    todas de uma vez). Posições em que os dois vetores coincidem são descartadas.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima;
+
+    - lca : objeto da classe lca_index() construído sobre a lista de predecessores e
+    o centroide usados em opt_matrix_constructor;
+
+    - node0 : nó (número do nó) do vetor de partida;
+
+    - node1 : nó (número do nó) do vetor de chegada.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - delta : tupla (posição, valor, posição, valor, ...), em ordem crescente de 
+    posição, com os consertos a aplicar no vetor de node0.
+
+    """
+
+    centroid = lca.root
+    common = lca.query(node0, node1)
+
+    vals = [{}, {}]
+    for side, node in enumerate((node0, node1)):
+        while node != common:
+            vec = opt_matrix[node]
+            for pos, val in aux_row_fix(vec):
+                vals[side].setdefault(pos, val)
+            node = vec[0] if vec[0] != -1 else lca.ancestor(node, 1)
+    val0, val1 = vals
+
+    # Valores, no LCA, das posições alteradas em apenas um dos lados
+    pending = set(val0).symmetric_difference(val1)
+    common_val = {}
+    node = common
+    while pending and node != centroid:
+        vec = opt_matrix[node]
+        for pos, val in aux_row_fix(vec):
+            if pos in pending:
+                common_val[pos] = val
+                pending.remove(pos)
+        node = vec[0] if vec[0] != -1 else lca.ancestor(node, 1)
+    for pos in pending:
+        common_val[pos] = opt_matrix[centroid][pos]
+
+    delta = []
+    for pos in sorted(set(val0).union(val1)):
+        new_val = val1[pos] if pos in val1 else common_val[pos]
+        old_val = val0[pos] if pos in val0 else common_val[pos]
+        if new_val != old_val:
+            delta += [pos, new_val]
+
+    return tuple(delta)
+
 def edges_constructor(matrix):
 
     """
@@ -212,97 +316,1095 @@ def aux_edges_constructor_numba(matrix):
 
 edges_constructor_numba = njit(aux_edges_constructor_numba)
 
-def opt_matrix_constructor(matrix, pred_list, centroid):
+def edge_index(i, j, rows):
 
     """
     _________________
     --- Descrição ---
     _________________
 
-    Função para construir matriz de armazenamento ótima.
+    Função para calcular a posição do arco (i, j), com i < j, no vetor de arestas do
+    grafo de similaridade completo. A ordem é a mesma de edges_constructor, isto é,
+    (0, 1), (0, 2), ..., (0, n-1), (1, 2), ... .
 
     __________________
     --- Argumentos ---
     __________________
 
-    - matrix : lista de listas com os dados originais;
+    - i : nó (número do nó) de partida, ou vetor de nós;
 
-    - pred_list : lista de predecessores para cada nó (representando um 
-    vetor da matriz original); 
+    - j : nó (número do nó) incidente, ou vetor de nós;
 
-    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
-    de similaridade, representando o vetor referência.
+    - rows : número de nós do grafo.
 
     ______________
     --- Saídas ---
     ______________
 
-    - opt_matrix : lista de lista representando matriz de armazenamento ótima.
+    - index : posição (ou vetor de posições) do arco no vetor de arestas.
 
     """
 
-    rows = len(matrix)
-    opt_matrix = [[] for _ in range(rows)]
-    opt_matrix[centroid] = matrix[centroid]
+    return i*rows - (i*(i+1))//2 + (j - i - 1)
 
-    for i in range(centroid):
-        node_pred = pred_list[i]
-        pred = matrix[node_pred]
-        son = matrix[i]
+def is_binary(matrix):
 
-        opt_matrix[i] += [node_pred] + find_diff(pred, son)
+    """
+    _________________
+    --- Descrição ---
+    _________________
 
-    for i in range(centroid+1, rows):
-        node_pred = pred_list[i]
-        pred = matrix[node_pred]
-        son = matrix[i]
+    Função para verificar se uma matriz contém apenas os valores 0 e 1.
 
-        opt_matrix[i] += [node_pred] + find_diff(pred, son)
+    __________________
+    --- Argumentos ---
+    __________________
 
-    return opt_matrix
+    - matrix : matriz numpy.
 
-def reconstruct_vector(opt_matrix, centroid, node):
+    ______________
+    --- Saídas ---
+    ______________
+
+    - binary : valor booleano, verdadeiro caso a matriz seja binária.
+
+    """
+
+    return bool(((matrix == 0) | (matrix == 1)).all())
+
+def pack_bits(matrix):
 
     """
     _________________
     --- Descrição ---
     _________________
 
-    Função para reconstruir vetor da matriz original.
+    Função para compactar uma matriz binária, armazenando cada linha em palavras de
+    64 bits (uint64). Cada palavra guarda 64 entradas da linha original; a última é
+    completada com zeros, o que não altera a distância de Hamming entre linhas.
 
     __________________
     --- Argumentos ---
     __________________
 
-    - opt_matrix : lista de listas representando matriz de armazenamento ótima;
+    - matrix : matriz numpy binária, de dimensão n x m.
 
-    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
-    de similaridade, representando o vetor referência;
+    ______________
+    --- Saídas ---
+    ______________
 
-    - node : nó (número do nó) representando vetor que se almeja reconstruir.
+    - packed : matriz uint64 de dimensão n x ceil(m/64).
+
+    """
+
+    rows, cols = matrix.shape
+    words = -(-cols//64)
+
+    packed = np.zeros((rows, words*8), dtype=np.uint8)
+    packed[:, :-(-cols//8)] = np.packbits(matrix.astype(np.uint8), axis=1)
+
+    return packed.view(np.uint64)
+
+def popcount(vec):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para contar, elemento a elemento, o número de bits 1 de um vetor de
+    inteiros sem sinal. Em versões do numpy sem bitwise_count, a contagem é feita
+    por tabela sobre os bytes de cada palavra.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - vec : vetor (ou matriz) numpy de inteiros sem sinal.
 
     ______________
     --- Saídas ---
     ______________
 
-    - real_vec : lista representando vetor reconstruído.
+    - count : vetor com o número de bits 1 de cada elemento.
 
     """
 
-    real_vec = opt_matrix[centroid].copy()
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(vec)
 
-    if node != centroid:
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    aux_bytes = table[vec.view(np.uint8)].reshape(vec.shape + (vec.itemsize,))
 
-        fix = find_fix(opt_matrix, centroid, node)
-        size_fix = len(fix)
-        
-        if size_fix != 0:
-            for i in range(0, size_fix, 2):
-                aux_index = fix[i]
-                aux_fix = fix[i+1]
-                real_vec[aux_index] = aux_fix
+    return aux_bytes.sum(axis=-1, dtype=np.uint8)
 
-    return real_vec
+def edges_constructor_block(matrix, tile=256):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para construir os arcos do grafo de similaridade em blocos. A matriz é
+    percorrida em ladrilhos (tiles) de tile x tile linhas, e, em cada um deles, as
+    diferenças são calculadas de uma só vez por comparação vetorizada (broadcast) e
+    soma. Assim, o pico de memória é limitado por tile*tile*m, independentemente do
+    número de linhas.
+
+    Os arcos são escritos em vetores pré-alocados de tamanho n(n-1)/2, na mesma ordem
+    de edges_constructor.
+
+    Caso a matriz seja binária ({0, 1}), as linhas são compactadas em palavras de
+    64 bits (pack_bits) e o custo de cada arco é calculado por XOR seguido de
+    contagem de bits (popcount).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - matrix : lista de listas ou matriz numpy, em que cada linha corresponde a um dado;
+
+    - tile : número de linhas por bloco. Por padrão, 256.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - src : vetor (int32) de nós de partida;
+
+    - dst : vetor (int32) de nós incidentes;
+
+    - weight : vetor de custos, com o menor tipo inteiro capaz de representar m.
+
+    """
+
+    matrix = np.asarray(matrix)
+    rows, cols = matrix.shape
+    num_edges = rows*(rows-1)//2
+
+    src = np.empty(num_edges, dtype=np.int32)
+    dst = np.empty(num_edges, dtype=np.int32)
+    weight = np.empty(num_edges, dtype=np.min_scalar_type(cols))
+
+    binary = is_binary(matrix)
+    if binary:
+        matrix = pack_bits(matrix)
+
+    for i0 in range(0, rows, tile):
+        i1 = min(i0 + tile, rows)
+        block_i = matrix[i0:i1]
+
+        for j0 in range(i0, rows, tile):
+            j1 = min(j0 + tile, rows)
+            block_j = matrix[j0:j1]
+
+            if binary:
+                local_cost = popcount(block_i[:, None, :] ^ block_j[None, :, :]).sum(axis=2)
+            else:
+                local_cost = (block_i[:, None, :] != block_j[None, :, :]).sum(axis=2)
+
+            ii, jj = np.nonzero(np.arange(i0, i1)[:, None] < np.arange(j0, j1)[None, :])
+            index = edge_index(ii + i0, jj + j0, rows)
+            src[index] = ii + i0
+            dst[index] = jj + j0
+            weight[index] = local_cost[ii, jj]
+
+    return src, dst, weight
+
+def aux_edges_constructor_parallel(matrix, src, dst, weight):
+
+    rows, cols = matrix.shape
+
+    # As linhas k e n-1-k são processadas pela mesma iteração, de modo que cada
+    # iteração do prange compare aproximadamente o mesmo número de pares.
+    for k in prange((rows+1)//2):
+        for t in range(2):
+
+            if t == 0:
+                i = np.int64(k)
+            else:
+                i = rows - 1 - np.int64(k)
+                if i == k:
+                    continue
+
+            base = i*rows - (i*(i+1))//2 - i - 1
+
+            for j in range(i+1, rows):
+
+                local_cost = 0
+                for c in range(cols):
+                    local_cost += matrix[i, c] != matrix[j, c]
+
+                src[base + j] = i
+                dst[base + j] = j
+                weight[base + j] = local_cost
+
+    return
+
+MASK_1 = np.uint64(0x5555555555555555)
+MASK_2 = np.uint64(0x3333333333333333)
+MASK_4 = np.uint64(0x0f0f0f0f0f0f0f0f)
+MASK_H = np.uint64(0x0101010101010101)
+
+def aux_popcount_word(x):
+
+    x = x - ((x >> np.uint64(1)) & MASK_1)
+    x = (x & MASK_2) + ((x >> np.uint64(2)) & MASK_2)
+    x = (x + (x >> np.uint64(4))) & MASK_4
+
+    return (x * MASK_H) >> np.uint64(56)
+
+popcount_word = njit(aux_popcount_word)
+
+def aux_edges_constructor_packed_parallel(packed, src, dst, weight):
+
+    rows, words = packed.shape
+
+    for k in prange((rows+1)//2):
+        for t in range(2):
+
+            if t == 0:
+                i = np.int64(k)
+            else:
+                i = rows - 1 - np.int64(k)
+                if i == k:
+                    continue
+
+            base = i*rows - (i*(i+1))//2 - i - 1
+
+            for j in range(i+1, rows):
+
+                local_cost = 0
+                for c in range(words):
+                    local_cost += popcount_word(packed[i, c] ^ packed[j, c])
+
+                src[base + j] = i
+                dst[base + j] = j
+                weight[base + j] = local_cost
+
+    return
+
+edges_constructor_parallel_numba = njit(aux_edges_constructor_parallel, parallel=True)
+edges_constructor_packed_parallel_numba = njit(aux_edges_constructor_packed_parallel, parallel=True)
+
+def edges_constructor_parallel(matrix, workers=None):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para construir os arcos do grafo de similaridade em paralelo (numba prange).
+    Os arcos são escritos em vetores pré-alocados de tamanho n(n-1)/2, indexados pela
+    posição triangular do par (i, j), na mesma ordem de edges_constructor. Caso a matriz
+    seja binária, as linhas são compactadas em palavras de 64 bits e o custo é calculado
+    por XOR e contagem de bits.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - matrix : lista de listas ou matriz numpy, em que cada linha corresponde a um dado;
+
+    - workers : número de threads utilizadas, limitado ao intervalo de 1 a 
+    config.NUMBA_NUM_THREADS. Por padrão, None, isto é, todas as disponíveis para o 
+    numba.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - src : vetor (int32) de nós de partida;
+
+    - dst : vetor (int32) de nós incidentes;
+
+    - weight : vetor de custos, com o menor tipo inteiro capaz de representar m.
+
+    """
+
+    matrix = np.ascontiguousarray(matrix)
+    rows, cols = matrix.shape
+    num_edges = rows*(rows-1)//2
+
+    src = np.empty(num_edges, dtype=np.int32)
+    dst = np.empty(num_edges, dtype=np.int32)
+    weight = np.empty(num_edges, dtype=np.min_scalar_type(cols))
+
+    threads = get_num_threads()
+    if workers is not None:
+        set_num_threads(max(1, min(int(workers), config.NUMBA_NUM_THREADS)))
+
+    try:
+        if is_binary(matrix):
+            edges_constructor_packed_parallel_numba(pack_bits(matrix), src, dst, weight)
+        else:
+            edges_constructor_parallel_numba(matrix, src, dst, weight)
+    finally:
+        set_num_threads(threads)
+
+    return src, dst, weight
+
+def edges_to_list(src, dst, weight):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para converter vetores de arestas (src, dst, weight) no formato de lista
+    de arestas [nó de partida, nó incidente, custo] usado por adj_list e pelos
+    algoritmos de AGM.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - src : vetor de nós de partida;
+
+    - dst : vetor de nós incidentes;
+
+    - weight : vetor de custos.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - edges : lista de arestas.
+
+    """
+
+    return np.column_stack((src, dst, weight)).tolist()
+
+def checkpoint_placement(pred_list, centroid, weight, depth_bound):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para escolher os nós armazenados por completo (checkpoints) de modo que
+    nenhum nó esteja a mais de depth_bound arestas de um ancestral materializado 
+    (o centroide ou um checkpoint), com o menor custo extra de armazenamento.
+
+    Resolve-se uma programação dinâmica na árvore, das folhas para a raiz: g(v, d) é o
+    menor custo da subárvore de v quando seu ancestral materializado mais próximo está
+    a d arestas. Transformar v em checkpoint custa weight[v] + soma de g(c, 1) sobre os
+    filhos c; não transformá-lo (possível apenas se d <= depth_bound) custa a soma de 
+    g(c, d+1). As decisões são então recuperadas da raiz para as folhas. Os nós são 
+    processados por nível de profundidade, com operações vetorizadas, em O(n D).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - pred_list : lista de predecessores para cada nó;
+
+    - centroid : nó (número do nó) centroide (raiz) da árvore;
+
+    - weight : vetor com o custo extra de armazenar cada nó por completo (pode ser 
+    negativo, quando o vetor completo é menor que seus consertos);
+
+    - depth_bound : número máximo de arestas (D) entre um nó e seu ancestral 
+    materializado mais próximo.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - checkpoint : vetor booleano indicando os nós escolhidos como checkpoint.
+
+    """
+
+    pred = np.array(pred_list, dtype=np.int64)
+    pred[centroid] = -1
+    weight = np.asarray(weight, dtype=np.int64)
+    depth = tree_depth(pred)
+
+    order = np.argsort(depth, kind="stable")
+    bounds = np.searchsorted(depth[order], np.arange(depth.max() + 2))
+
+    # S[v, d-1] = soma de g(c, d) sobre os filhos c de v, d = 1..D+1
+    S = np.zeros((len(pred), depth_bound + 1), dtype=np.int64)
+    for d in range(len(bounds) - 2, 0, -1):
+        level = order[bounds[d]:bounds[d+1]]
+        ck = weight[level] + S[level, 0]
+        g = np.empty((len(level), depth_bound + 1), dtype=np.int64)
+        g[:, :depth_bound] = np.minimum(ck[:, None], S[level, 1:])
+        g[:, depth_bound] = ck
+        np.add.at(S, pred[level], g)
+
+    dist = np.zeros(len(pred), dtype=np.int64)
+    checkpoint = np.zeros(len(pred), dtype=bool)
+    for d in range(1, len(bounds) - 1):
+        level = order[bounds[d]:bounds[d+1]]
+        hops = dist[pred[level]] + 1
+        ck = weight[level] + S[level, 0]
+        keep = np.minimum(hops, depth_bound)
+        choose = (hops > depth_bound) | (ck <= S[level, keep])
+        checkpoint[level] = choose
+        dist[level] = np.where(choose, 0, hops)
+
+    return checkpoint
+
+def opt_matrix_constructor(matrix, pred_list, centroid, depth_bound=None):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para construir matriz de armazenamento ótima.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - matrix : lista de listas com os dados originais;
+
+    - pred_list : lista de predecessores para cada nó (representando um 
+    vetor da matriz original); 
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência. Qualquer raiz usada em 
+    direct_out_tree é aceita, como a de weighted_root_search;
+
+    - depth_bound : se diferente de None, número máximo de arestas entre um nó e seu
+    ancestral materializado mais próximo. Os nós escolhidos por checkpoint_placement
+    são armazenados por completo, como [-1] + vetor, limitando o custo de 
+    reconstruct_vector.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - opt_matrix : lista de lista representando matriz de armazenamento ótima.
+
+    """
+
+    rows = len(matrix)
+    opt_matrix = [[] for _ in range(rows)]
+    opt_matrix[centroid] = matrix[centroid]
+
+    for i in range(centroid):
+        node_pred = pred_list[i]
+        pred = matrix[node_pred]
+        son = matrix[i]
+
+        opt_matrix[i] += [node_pred] + find_diff(pred, son)
+
+    for i in range(centroid+1, rows):
+        node_pred = pred_list[i]
+        pred = matrix[node_pred]
+        son = matrix[i]
+
+        opt_matrix[i] += [node_pred] + find_diff(pred, son)
+
+    if depth_bound is not None:
+        cols = len(matrix[centroid])
+        weight = [cols - (len(vec) - 1) for vec in opt_matrix]
+        for i in np.flatnonzero(checkpoint_placement(pred_list, centroid, weight, depth_bound)):
+            opt_matrix[i] = [-1] + list(matrix[i])
+
+    return opt_matrix
+
+def aux_narrow_type(vec):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para definir o menor tipo inteiro capaz de representar todos os
+    valores de um vetor.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - vec : vetor numpy de inteiros.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - dtype : tipo numpy.
+
+    """
+
+    if len(vec) == 0:
+        return np.dtype(np.uint8)
+
+    return np.result_type(np.min_scalar_type(vec.min()), np.min_scalar_type(vec.max()))
+
+class packed_opt_matrix():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para representação compacta da matriz de armazenamento ótima. Em vez de uma
+    lista de listas de inteiros do Python (cada um ocupando dezenas de bytes), os dados
+    são guardados em vetores numpy planos, de tipos estreitos, à maneira do formato CSR:
+    os consertos do nó i ocupam as posições offsets[i]..offsets[i+1]-1 de diff_pos e 
+    diff_val. Nós sem predecessor (pred = -1), como o centroide, guardam o vetor
+    completo, isto é, um conserto para cada posição.
+
+    Assim, o número de bytes efetivamente ocupado (nbytes) corresponde à redução de
+    armazenamento medida.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - matrix : lista de listas ou matriz numpy com os dados originais;
+
+    - pred_list : lista de predecessores para cada nó;
+
+    - centroid : nó (número do nó) centroide (raiz) da árvore de armazenamento;
+
+    - depth_bound : se diferente de None, nós escolhidos por checkpoint_placement 
+    também são armazenados por completo, como em opt_matrix_constructor. Aqui, um 
+    vetor completo ocupa m posições e m valores, contra 2k de seus k consertos, de 
+    modo que o custo extra de um checkpoint é 2(m - k).
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - centroid : nó raiz;
+
+    - cols : número de colunas (m) dos dados;
+
+    - pred : vetor (int32) de predecessores, -1 para nós armazenados por completo;
+
+    - offsets : vetor de n+1 posições iniciais dos consertos de cada nó;
+
+    - diff_pos : vetor de posições dos consertos;
+
+    - diff_val : vetor de valores dos consertos.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : constrói os vetores a partir dos dados originais;
+
+    - from_opt_matrix : constrói a representação compacta a partir da lista de listas
+    de opt_matrix_constructor;
+
+        * Argumentos: 
+
+            - opt_matrix : lista de listas representando matriz de armazenamento ótima;
+
+            - centroid : nó (número do nó) centroide.
+
+    - row_diff : retorna vistas (sem cópia) das posições e valores dos consertos de 
+    um nó;
+
+        * Argumentos: 
+
+            - node : nó (número do nó).
+
+    - nbytes : número de bytes ocupados pelos vetores;
+
+    - size : número de elementos armazenados, contado como em size(opt_matrix).
+
+    """
+
+    def __init__(self, matrix, pred_list, centroid, depth_bound=None):
+
+        matrix = np.asarray(matrix)
+        rows, self.cols = matrix.shape
+        self.centroid = centroid
+
+        parent = np.array(pred_list, dtype=np.int64)
+        parent[centroid] = centroid
+        mismatch = matrix != matrix[parent]
+        mismatch[centroid] = True
+        parent[centroid] = -1
+
+        if depth_bound is not None:
+            weight = 2*(self.cols - mismatch.sum(axis=1))
+            checkpoint = checkpoint_placement(pred_list, centroid, weight, depth_bound)
+            mismatch[checkpoint] = True
+            parent[checkpoint] = -1
+
+        node, pos = np.nonzero(mismatch)
+        self.aux_set_arrays(parent, np.bincount(node, minlength=rows), pos, matrix[node, pos])
+
+    @classmethod
+    def from_opt_matrix(cls, opt_matrix, centroid):
+
+        packed = cls.__new__(cls)
+        packed.centroid = centroid
+        packed.cols = len(opt_matrix[centroid])
+
+        parent = np.array([vec[0] if i != centroid else -1 for i, vec in enumerate(opt_matrix)], dtype=np.int64)
+        count = np.array([(len(vec) - 1)//2 if parent[i] != -1 else packed.cols for i, vec in enumerate(opt_matrix)])
+
+        pos, val = [], []
+        for i, vec in enumerate(opt_matrix):
+            if i == centroid:
+                pos += range(packed.cols)
+                val += vec
+            elif parent[i] == -1:
+                pos += range(packed.cols)
+                val += vec[1:]
+            else:
+                pos += vec[1::2]
+                val += vec[2::2]
+
+        packed.aux_set_arrays(parent, count, np.array(pos, dtype=np.int64), np.array(val))
+
+        return packed
+
+    def aux_set_arrays(self, parent, count, pos, val):
+
+        self.pred = parent.astype(np.int32)
+        self.offsets = np.zeros(len(count)+1, dtype=np.int64)
+        np.cumsum(count, out=self.offsets[1:])
+        self.offsets = self.offsets.astype(aux_narrow_type(self.offsets))
+        self.diff_pos = pos.astype(np.min_scalar_type(max(self.cols - 1, 0)))
+        self.diff_val = val.astype(aux_narrow_type(val))
+
+        return
+
+    def row_diff(self, node):
+
+        beg, end = self.offsets[node], self.offsets[node+1]
+
+        return self.diff_pos[beg:end], self.diff_val[beg:end]
+
+    @property
+    def nbytes(self):
+
+        return self.pred.nbytes + self.offsets.nbytes + self.diff_pos.nbytes + self.diff_val.nbytes
+
+    def size(self):
+
+        count = np.diff(self.offsets.astype(np.int64))
+        root = self.pred == -1
+
+        return int(len(root) - 1 + 2*count[~root].sum() + count[root].sum())
+
+def reconstruct_vector(opt_matrix, centroid, node):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para reconstruir vetor da matriz original.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência;
+
+    - node : nó (número do nó) representando vetor que se almeja reconstruir.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - real_vec : lista representando vetor reconstruído.
+
+    """
+
+    real_vec = opt_matrix[centroid].copy()
+
+    if node != centroid:
+
+        fix = find_fix(opt_matrix, centroid, node)
+        size_fix = len(fix)
+        
+        if size_fix != 0:
+            for i in range(0, size_fix, 2):
+                aux_index = fix[i]
+                aux_fix = fix[i+1]
+                real_vec[aux_index] = aux_fix
+
+    return real_vec
+
+def reconstruct_vector_array(opt_matrix, centroid, node):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para reconstruir vetor da matriz original com operações vetorizadas. A 
+    cadeia de ancestrais do nó é coletada como vetor de índices e os consertos são
+    concatenados da raiz (centroide ou checkpoint) para o nó; como, em uma mesma posição, prevalece o conserto
+    mais próximo do nó, mantém-se apenas a última ocorrência de cada posição, e todos
+    os consertos são aplicados de uma só vez por indexação avançada do numpy.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima, ou
+    objeto da classe packed_opt_matrix;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência;
+
+    - node : nó (número do nó) representando vetor que se almeja reconstruir.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - real_vec : vetor numpy reconstruído.
+
+    """
+
+    if isinstance(opt_matrix, packed_opt_matrix):
+
+        chain = [node]
+        while opt_matrix.pred[chain[-1]] != -1:
+            chain.append(opt_matrix.pred[chain[-1]])
+
+        chain = np.array(chain[::-1], dtype=np.int64)
+        offsets = opt_matrix.offsets.astype(np.int64)
+        beg, count = offsets[chain], offsets[chain+1] - offsets[chain]
+        index = np.repeat(beg - np.cumsum(count) + count, count) + np.arange(count.sum())
+
+        pos = opt_matrix.diff_pos[index]
+        val = opt_matrix.diff_val[index]
+        real_vec = np.zeros(opt_matrix.cols, dtype=val.dtype)
+
+    else:
+
+        real_vec = np.array(opt_matrix[centroid])
+        if node == centroid:
+            return real_vec
+
+        chain = [node]
+        while opt_matrix[chain[-1]][0] not in (centroid, -1):
+            chain.append(opt_matrix[chain[-1]][0])
+
+        if opt_matrix[chain[-1]][0] == -1:
+            real_vec = np.array(opt_matrix[chain.pop()][1:])
+
+        fix = np.array([value for i in reversed(chain) for value in opt_matrix[i][1:]], dtype=np.int64)
+        pos, val = fix[0::2], fix[1::2]
+
+    _, last = np.unique(pos[::-1], return_index=True)
+    last = len(pos) - 1 - last
+    real_vec[pos[last]] = val[last]
+
+    return real_vec
+
+class opt_reader():
+
+    """ 
+    _________________
+    --- Descrição ---
+    _________________
+
+    Classe para leitura repetida de vetores da matriz de armazenamento ótima. Os 
+    vetores materializados durante uma reconstrução (o do nó pedido e os de seus 
+    ancestrais) são guardados em uma cache LRU, indexada pelo número do nó e limitada 
+    em bytes. Uma consulta sobe a árvore apenas até o ancestral em cache mais próximo e
+    aplica, a partir dele, os consertos restantes; quando nenhum ancestral está em 
+    cache, parte-se do centroide ou de um checkpoint.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima, ou
+    objeto da classe packed_opt_matrix;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência;
+
+    - max_bytes : número máximo de bytes ocupados pelos vetores em cache.
+
+    _________________
+    --- Atributos ---
+    _________________
+
+    - packed : objeto da classe packed_opt_matrix;
+
+    - cache : dicionário ordenado (OrderedDict) nó -> vetor, do menos ao mais 
+    recentemente usado;
+
+    - max_bytes : limite de bytes da cache;
+
+    - nbytes : número de bytes ocupados pelos vetores em cache;
+
+    - hits : número de consultas iniciadas a partir de um vetor em cache;
+
+    - misses : número de consultas iniciadas a partir do centroide ou de um checkpoint.
+
+    _______________
+    --- Métodos ---
+    _______________
+
+    - __init___ : inicializa a cache vazia;
+
+    - reconstruct : retorna o vetor (numpy) reconstruído de um nó;
+
+        * Argumentos: 
+
+            - node : nó (número do nó) representando vetor que se almeja reconstruir.
+
+    - clear : esvazia a cache e zera os contadores.
+
+    """
+
+    def __init__(self, opt_matrix, centroid, max_bytes=2**24):
+
+        if not isinstance(opt_matrix, packed_opt_matrix):
+            opt_matrix = packed_opt_matrix.from_opt_matrix(opt_matrix, centroid)
+
+        self.packed = opt_matrix
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def reconstruct(self, node):
+
+        pred = self.packed.pred
+        chain = []
+        while node != -1 and node not in self.cache:
+            chain.append(node)
+            node = pred[node]
+
+        if node != -1:
+            self.hits += 1
+            self.cache.move_to_end(node)
+            real_vec = self.cache[node].copy()
+        else:
+            self.misses += 1
+            real_vec = np.zeros(self.packed.cols, dtype=self.packed.diff_val.dtype)
+
+        rows = []
+        for node in reversed(chain):
+            pos, val = self.packed.row_diff(node)
+            real_vec[pos] = val
+            rows.append((node, real_vec.copy()))
+
+        # Ancestrais entram por último, sendo os últimos a deixar a cache
+        for node, vec in reversed(rows):
+            self.aux_insert(node, vec)
+
+        return real_vec
+
+    def aux_insert(self, node, vec):
+
+        if vec.nbytes > self.max_bytes:
+            return
+
+        while self.nbytes + vec.nbytes > self.max_bytes:
+            _, old = self.cache.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+        self.cache[node] = vec
+        self.nbytes += vec.nbytes
+
+        return
+
+    def clear(self):
+
+        self.cache = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        return
+
+def aux_reconstruct(packed, needed):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função auxiliar para reconstruir os vetores de um conjunto de nós fechado por
+    ancestrais (todo predecessor de um nó do conjunto também pertence a ele). Os nós
+    são processados por nível de profundidade, de cima para baixo: cada nível copia,
+    de uma só vez, os vetores já reconstruídos de seus predecessores e aplica, também
+    de uma só vez, todos os seus consertos.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - packed : objeto da classe packed_opt_matrix;
+
+    - needed : vetor de nós a reconstruir.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - out : matriz numpy com os vetores reconstruídos, na ordem de needed.
+
+    """
+
+    pred = packed.pred.astype(np.int64)
+    offsets = packed.offsets.astype(np.int64)
+
+    local = np.full(len(pred), -1, dtype=np.int64)
+    local[needed] = np.arange(len(needed))
+    out = np.empty((len(needed), packed.cols), dtype=packed.diff_val.dtype)
+
+    depth = tree_depth(pred)[needed]
+    order = needed[np.argsort(depth, kind="stable")]
+    bounds = np.searchsorted(np.sort(depth), np.arange(depth.max(initial=-1) + 2))
+
+    for d in range(len(bounds) - 1):
+
+        level = order[bounds[d]:bounds[d+1]]
+        if d > 0:
+            out[local[level]] = out[local[pred[level]]]
+
+        beg = offsets[level]
+        count = offsets[level+1] - beg
+        position = np.repeat(beg - np.cumsum(count) + count, count) + np.arange(count.sum())
+        out[np.repeat(local[level], count), packed.diff_pos[position]] = packed.diff_val[position]
+
+    return out
+
+def reconstruct_all(opt_matrix, centroid):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para reconstruir, de uma só vez, todos os vetores da matriz original. Em vez
+    de subir, para cada nó, até o centroide (como em reconstruct_vector), a árvore de 
+    armazenamento é percorrida uma única vez a partir do centroide, nível a nível: o 
+    vetor de cada nó é obtido aplicando seus consertos ao vetor, já reconstruído, de seu
+    predecessor. O custo total é O(n m + número total de consertos).
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima, ou
+    objeto da classe packed_opt_matrix;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - real_matrix : matriz numpy com todos os vetores reconstruídos.
+
+    """
+
+    if not isinstance(opt_matrix, packed_opt_matrix):
+        opt_matrix = packed_opt_matrix.from_opt_matrix(opt_matrix, centroid)
+
+    return aux_reconstruct(opt_matrix, np.arange(len(opt_matrix.pred)))
+
+def reconstruct_subset(opt_matrix, centroid, nodes):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para reconstruir, de uma só vez, os vetores de um subconjunto de nós. 
+    Primeiro, marcam-se os nós pedidos e todos os seus ancestrais; depois, apenas essa
+    parte da árvore é percorrida a partir do centroide, como em reconstruct_all, de 
+    modo que ancestrais comuns são reconstruídos uma única vez.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima, ou
+    objeto da classe packed_opt_matrix;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência;
+
+    - nodes : lista de nós (números dos nós) cujos vetores se almeja reconstruir.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - real_matrix : matriz numpy com os vetores reconstruídos, na ordem de nodes.
+
+    """
+
+    if not isinstance(opt_matrix, packed_opt_matrix):
+        opt_matrix = packed_opt_matrix.from_opt_matrix(opt_matrix, centroid)
+
+    pred = opt_matrix.pred.astype(np.int64)
+    nodes = np.asarray(nodes, dtype=np.int64)
+
+    mark = np.zeros(len(pred), dtype=bool)
+    frontier = np.unique(nodes)
+    while len(frontier) != 0:
+        mark[frontier] = True
+        frontier = pred[frontier]
+        frontier = np.unique(frontier[frontier >= 0])
+        frontier = frontier[~mark[frontier]]
+
+    needed = np.flatnonzero(mark)
+    out = aux_reconstruct(opt_matrix, needed)
+
+    return out[np.searchsorted(needed, nodes)]
+
+def checkpoint_report(opt_matrix, centroid):
+
+    """
+    _________________
+    --- Descrição ---
+    _________________
+
+    Função para resumir o compromisso entre armazenamento e latência de uma matriz de
+    armazenamento ótima, com ou sem checkpoints. A latência de um nó é medida pelo 
+    número de linhas percorridas (saltos) até o ancestral materializado mais próximo.
+
+    __________________
+    --- Argumentos ---
+    __________________
+
+    - opt_matrix : lista de listas representando matriz de armazenamento ótima, ou
+    objeto da classe packed_opt_matrix;
+
+    - centroid : nó (número do nó) centroide da árvore geradora mínima (AGM) 
+    de similaridade, representando o vetor referência.
+
+    ______________
+    --- Saídas ---
+    ______________
+
+    - report : dicionário com o tamanho (size), o número de checkpoints 
+    (checkpoints), e o número máximo (max_hops) e médio (mean_hops) de saltos.
+
+    """
+
+    if isinstance(opt_matrix, packed_opt_matrix):
+        pred = opt_matrix.pred.astype(np.int64)
+        storage = opt_matrix.size()
+    else:
+        pred = np.array([vec[0] if i != centroid else -1 for i, vec in enumerate(opt_matrix)], dtype=np.int64)
+        storage = size(opt_matrix)
+
+    hops = tree_depth(pred)
+
+    report = {"size": storage,
+              "checkpoints": int((pred == -1).sum()) - 1,
+              "max_hops": int(hops.max()),
+              "mean_hops": float(hops.mean())}
+
+    return report
 
 def str_reduction(n, m, k):
 